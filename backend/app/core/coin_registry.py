@@ -30,9 +30,11 @@ class CoinRegistry:
     _instance: Optional['CoinRegistry'] = None
     _coins: Dict[str, CoinConfig] = {}
     _coin_order: List[str] = []  # Coin order from config
+    _by_source: Dict[str, Dict[str, CoinConfig]] = {}  # source -> external ID -> coin
     _config_path: Optional[Path] = None
     _last_modified: Optional[float] = None  # Time of last file modification
     _config_hash: Optional[str] = None  # Hash of entire config content
+    _version: int = 0  # Incremented on every successful (re)load
     
     def __new__(cls):
         if cls._instance is None:
@@ -91,9 +93,17 @@ class CoinRegistry:
                 self._coins[coin_config.id] = coin_config
                 self._coin_order.append(coin_config.id)
             
+            # Reverse index for external ID lookups (first coin wins on duplicates)
+            by_source: Dict[str, Dict[str, CoinConfig]] = {}
+            for coin_config in self._coins.values():
+                for source, external_id in coin_config.external_ids.items():
+                    by_source.setdefault(source, {}).setdefault(external_id, coin_config)
+            self._by_source = by_source
+            
             # Update modification time and hash
             self._last_modified = os.path.getmtime(self._config_path)
             self._config_hash = new_config_hash
+            self._version += 1
             
         except Exception as e:
             logger.error(f"Configuration loading error: {e}", exc_info=True)
@@ -136,10 +146,10 @@ class CoinRegistry:
         return coin.price_priority.copy()
     
     def find_coin_by_external_id(self, source: str, external_id: str) -> Optional[CoinConfig]:
-        for coin in self._coins.values():
-            if coin.external_ids.get(source) == external_id:
-                return coin
-        return None
+        source_map = self._by_source.get(source)
+        if source_map is None:
+            return None
+        return source_map.get(external_id)
     
     def find_coin_by_symbol(self, symbol: str, enabled_only: bool = True) -> Optional[CoinConfig]:
         symbol_upper = symbol.upper()
@@ -161,6 +171,10 @@ class CoinRegistry:
     
     def get_config_hash(self) -> Optional[str]:
         return self._config_hash
+    
+    def get_version(self) -> int:
+        """Version of loaded config, changes whenever coins are (re)loaded"""
+        return self._version
 
 
 # Global registry instance
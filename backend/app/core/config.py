@@ -45,6 +45,8 @@ class Settings(BaseSettings):
     CACHE_TTL_PRICE: int = Field(default=86400)
     CACHE_TTL_CHART: int = Field(default=60)
     CACHE_TTL_IMAGE: int = Field(default=604800)
+    CACHE_TTL_CHART_MISS: int = Field(default=60)  # "No chart from any provider" results
+    CACHE_TTL_PRICE_MISS: int = Field(default=10)  # "No price from any provider" results
 
     # WebSocket
     WS_RECONNECT_DELAY: int = Field(default=1)
@@ -53,10 +55,17 @@ class Settings(BaseSettings):
     # Chart storage
     CHART_STORAGE_MAX_ITEMS: int = Field(default=500)
     CHART_STORAGE_TTL_HOURS: int = Field(default=24)
+    CHART_RENDER_PROCESSES: int = Field(default=0)  # 0 = one render process per CPU
 
     # HTTP client
-    HTTP_MAX_CONNECTIONS: int = Field(default=10)
-    HTTP_MAX_KEEPALIVE: int = Field(default=5)
+    HTTP_MAX_CONNECTIONS: int = Field(default=100)
+    HTTP_MAX_KEEPALIVE: int = Field(default=20)
+    HTTP2_ENABLED: bool = Field(default=True)
+
+    # Provider circuit breakers
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = Field(default=5)
+    CIRCUIT_BREAKER_SLEEP_WINDOW: float = Field(default=10.0)
+    CIRCUIT_BREAKER_ERROR_PERCENTAGE: int = Field(default=50)
 
     model_config = SettingsConfigDict(
         env_file=_ENV_FILE,
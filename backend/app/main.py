@@ -13,6 +13,7 @@ from app.services.bot_polling import bot_polling
 from app.services.notification_checker import notification_checker
 from app.services.chart_generator import chart_generator
 from app.services.chart_storage import chart_storage
+from app.services.coingecko_quick import coingecko_quick
 from app.providers.cex.binance_websocket import binance_websocket_worker
 from app.providers.cex.okx_websocket import okx_websocket_worker
 from app.providers.cex.mexc_websocket import mexc_websocket_worker
@@ -65,6 +66,8 @@ async def lifespan(app: FastAPI):
         create_supervised_task(mexc_websocket_worker.start, "mexc_websocket"),
         create_supervised_task(coingecko_price_updater.start, "coingecko_updater"),
         create_supervised_task(_periodic_chart_cleanup, "chart_cleanup", restart_on_failure=False),
+        create_supervised_task(chart_generator.warm_up, "chart_warm_up", restart_on_failure=False),
+        create_supervised_task(coingecko_quick.refresh_known_coins, "coingecko_known_coins"),
     ]
 
     yield
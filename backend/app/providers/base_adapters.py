@@ -3,10 +3,30 @@ Base classes for data provider adapters
 """
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Dict, List, NotRequired, Optional, TypedDict
+
+import msgspec
 
 logger = logging.getLogger(__name__)
 
+
+class PriceData(TypedDict):
+    """
+    Price payload stored under coin_price:{coin_id}
+
+    Only price is required: older or partial entries may lack the other
+    fields, readers fall back with .get().
+    """
+    price: float
+    percent_change_24h: NotRequired[float]
+    volume_24h: NotRequired[float]
+    priceDecimals: NotRequired[int]
+
+
+# Decodes and validates cached payloads in a single pass
+_price_decoder = msgspec.json.Decoder(PriceData)
+
+
 class BasePriceAdapter(ABC):
     """Base class for price adapters"""
     
@@ -45,7 +65,7 @@ class BasePriceAdapter(ABC):
         coin_id: str,
         source: str,
         adapter_name: str
-    ) -> Optional[Dict]:
+    ) -> Optional[PriceData]:
         """
         Common method for reading price from Redis cache
         
@@ -59,7 +79,6 @@ class BasePriceAdapter(ABC):
         """
         from app.core.coin_registry import coin_registry
         from app.core.redis_client import get_redis
-        import json
         
         # Find internal coin ID by external symbol
         internal_coin = coin_registry.find_coin_by_external_id(source, coin_id)
@@ -77,16 +96,66 @@ class BasePriceAdapter(ABC):
             cached_data = await redis.get(cache_key)
             
             if cached_data:
-                # Deserialize JSON (handle bytes and str)
-                if isinstance(cached_data, bytes):
-                    cached_data = cached_data.decode('utf-8')
-                price_data = json.loads(cached_data)
-                return price_data
-                
+                return _price_decoder.decode(cached_data)
+
+        except msgspec.DecodeError as e:
+            # Unusable entry, treated as a cache miss
+            logger.debug(f"[{adapter_name}] Invalid cached price for {coin_id}: {e}")
         except Exception as e:
             logger.error(f"[{adapter_name}] Error reading price for {coin_id}: {e}")
     
         return None
+    
+    async def _get_prices_from_redis(
+        self,
+        coin_ids: List[str],
+        source: str,
+        adapter_name: str
+    ) -> Dict[str, PriceData]:
+        """
+        Common method for reading multiple prices from Redis cache with a single MGET
+        
+        Args:
+            coin_ids: External coin IDs (e.g., ["BTCUSDT", "ETHUSDT"] for Binance)
+            source: Data source ("binance", "okx")
+            adapter_name: Adapter name for logging (e.g., "BinancePriceAdapter")
+            
+        Returns:
+            Dictionary {coin_id: price data} for coins found in cache
+        """
+        from app.core.coin_registry import coin_registry
+        from app.core.redis_client import get_redis
+        
+        # Resolve internal coin IDs up front
+        resolved = []
+        for coin_id in coin_ids:
+            internal_coin = coin_registry.find_coin_by_external_id(source, coin_id)
+            if internal_coin:
+                resolved.append((coin_id, internal_coin.id))
+        
+        if not resolved:
+            return {}
+        
+        redis = await get_redis()
+        if not redis:
+            return {}
+        
+        result = {}
+        try:
+            values = await redis.mget([f"coin_price:{internal_id}" for _, internal_id in resolved])
+            
+            for (coin_id, _), cached_data in zip(resolved, values):
+                if not cached_data:
+                    continue
+                try:
+                    result[coin_id] = _price_decoder.decode(cached_data)
+                except msgspec.DecodeError as e:
+                    logger.debug(f"[{adapter_name}] Invalid cached price for {coin_id}: {e}")
+                    
+        except Exception as e:
+            logger.error(f"[{adapter_name}] Error reading prices for {len(resolved)} coins: {e}")
+        
+        return result
 
 
 class BaseChartAdapter(ABC):
@@ -3,10 +3,11 @@ Base Chart Adapter with common functionality
 """
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
-from datetime import datetime
+
+import numpy as np
 
 from app.core.coin_registry import coin_registry
-from app.utils.formatters import format_chart_date
+from app.utils.formatters import format_chart_dates
 
 
 class BaseChartAdapter(ABC):
@@ -66,31 +67,45 @@ class BaseChartAdapter(ABC):
             return None
     
     def _process_candles(self, candles: List, period: str) -> List[Dict]:   
-        """Process raw candles to chart format"""
-        chart_data = []
+        """
+        Process raw candles to chart format
         
-        for candle in candles:
-            timestamp = candle[0]
-            close_price = float(candle[4])
-            volume = float(candle[5]) if len(candle) > 5 else 0
-            
-            if isinstance(timestamp, str):
-                timestamp = int(timestamp)
-            
-            timestamp_seconds = timestamp / 1000
-            
-            # Create datetime in UTC
-            from datetime import datetime, timezone
-            date_obj = datetime.fromtimestamp(timestamp_seconds, tz=timezone.utc)
-            
-            # Return in ISO format with timezone
-            date_str = date_obj.isoformat()  # Example: "2025-12-17T18:12:12+00:00"
-            
-            chart_data.append({
+        Columns are converted in bulk with NumPy instead of per-candle
+        int()/float()/datetime calls.
+        """
+        rows = np.array(candles, dtype=object)
+        if rows.ndim != 2:
+            # Ragged rows (some candles without volume) - pad to a common width
+            rows = np.array(
+                [list(candle[:6]) + [0] * (6 - len(candle[:6])) for candle in candles],
+                dtype=object,
+            )
+        
+        # Timestamps may come as str or int depending on exchange
+        timestamps = rows[:, 0].astype(np.int64)
+        close_prices = rows[:, 4].astype(np.float64)
+        if rows.shape[1] > 5:
+            volumes = rows[:, 5].astype(np.float64)
+        else:
+            volumes = np.zeros(len(rows), dtype=np.float64)
+        
+        # Exchanges return candles either oldest-first (Binance, MEXC) or
+        # newest-first (OKX) - reverse the views instead of sorting
+        if len(timestamps) > 1 and timestamps[0] > timestamps[-1]:
+            timestamps = timestamps[::-1]
+            close_prices = close_prices[::-1]
+            volumes = volumes[::-1]
+        
+        # ISO format in UTC with timezone, example: "2025-12-17T18:12:12+00:00"
+        dates = format_chart_dates(timestamps)
+        
+        return [
+            {
                 "date": date_str,  # ISO format with timezone
                 "price": close_price,
                 "volume": volume,
-            })
-        
-        chart_data.sort(key=lambda x: x["date"])
-        return chart_data
\ No newline at end of file
+            }
+            for date_str, close_price, volume in zip(
+                dates, close_prices.tolist(), volumes.tolist()
+            )
+        ]
@@ -8,18 +8,21 @@ Contains common logic for all WebSocket providers:
 - Lifecycle management
 """
 import asyncio
-import json
 import logging
 import random
+import time
+from collections import OrderedDict
+import orjson
 import websockets
+from redis.exceptions import RedisError
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, Set, Tuple, Callable
+from typing import Dict, Optional, Set, Tuple, Callable, Union
 from pathlib import Path
 
 from app.core.config import settings
 from app.core.redis_client import get_redis
-from app.core.coin_registry import coin_registry
-from app.utils.websocket_price_handler import process_price_update
+from app.core.coin_registry import coin_registry, CoinConfig
+from app.utils.websocket_price_handler import build_price_update, trigger_notification_check
 
 
 class BaseWebSocketWorker(ABC):
@@ -38,8 +41,14 @@ class BaseWebSocketWorker(ABC):
     
     RECONNECT_DELAY_INITIAL = settings.WS_RECONNECT_DELAY
     RECONNECT_DELAY_MAX = settings.WS_MAX_RECONNECT_DELAY
+    STABLE_CONNECTION_TIME = 30.0  # Reset backoff after staying connected this long
+    PING_INTERVAL = 20  # Protocol-level keepalive ping
+    PING_TIMEOUT = 10  # Close connection if pong doesn't arrive in time
+    MESSAGE_TIMEOUT = 2 * PING_INTERVAL  # Reconnect if no messages arrive at all
+    MAX_MESSAGE_SIZE = 2 ** 20  # Ticker frames are small; bound memory for malformed ones
     PRICE_UPDATE_INTERVAL = 0.1  # Update cache every 100ms
     LOG_INTERVAL = 5.0  # Logging statistics interval
+    ERROR_LOG_INTERVAL = 1.0  # Max one traceback per exception type per interval
     
     def __init__(self, source: str):
         """
@@ -50,10 +59,18 @@ class BaseWebSocketWorker(ABC):
         self._running = False
         self._task: Optional[asyncio.Task] = None
         self._ws: Optional[websockets.WebSocketClientProtocol] = None
+        self._redis = None  # Redis handle bound per WebSocket connection
         self._tracked_coins: Set[str] = set()  # Set of internal IDs from config
-        self._last_update_time: Dict[str, float] = {}  # For tracking update frequency
-        self._coins_with_updates: Set[str] = set()  # Coins with updates in the last period
+        # Coin -> last update time, oldest first; only coins updated in the last period are kept
+        self._last_update_time: "OrderedDict[str, float]" = OrderedDict()
         self._last_log_time: float = 0.0  # Time of last log
+        self._symbol_to_coin: Dict[str, CoinConfig] = {}  # Source symbol -> coin
+        self._priority_coins: Set[str] = set()  # Coins with this source as first price priority
+        self._coin_maps_version: Optional[int] = None  # Registry version the maps were built from
+        self._coins_with_source_count: int = 0  # Tracked coins that have an ID on this source
+        self._price_decimals: Dict[str, Tuple[float, float, int]] = {}  # Coin -> cached decimals range
+        self._error_log_times: Dict[type, float] = {}  # Exception type -> last logged time
+        self._suppressed_errors: Dict[type, int] = {}  # Exception type -> errors not logged since
         self._logger = logging.getLogger(f"websocket.{source}")
 
     
@@ -73,12 +90,12 @@ class BaseWebSocketWorker(ABC):
         pass
     
     @abstractmethod
-    def _parse_message(self, message: str) -> Optional[list]:
+    def _parse_message(self, message: Union[str, bytes]) -> Optional[list]:
         """
         Parse message and extract list of tickers
         
         Args:
-            message: Raw message from WebSocket
+            message: Raw message from WebSocket (str for text frames, bytes for binary)
             
         Returns:
             List of tickers (dict) or None if not tickers
@@ -105,6 +122,22 @@ class BaseWebSocketWorker(ABC):
         """Get function to extract volume from ticker"""
         pass
     
+    def _get_values_extractor(self) -> Callable[[Dict], Tuple[float, float, float]]:
+        """
+        Get function to extract (price, price change, volume) from ticker
+        
+        Combines the single-field extractors by default. Workers whose fields
+        depend on each other can override it to parse shared fields once.
+        """
+        price_extractor = self._get_price_extractor()
+        price_change_extractor = self._get_price_change_extractor()
+        volume_extractor = self._get_volume_extractor()
+        
+        def extractor(t: Dict) -> Tuple[float, float, float]:
+            return price_extractor(t), price_change_extractor(t), volume_extractor(t)
+        
+        return extractor
+    
     def _load_coins_config(self) -> list[str]:
         """Load coin list from registry for this source"""
         try:
@@ -117,6 +150,44 @@ class BaseWebSocketWorker(ABC):
             self._logger.error(f"Error loading coins from registry: {e}")
             return []
     
+    def _refresh_coin_maps(self):
+        """Rebuild symbol and priority lookups if the registry has changed"""
+        version = coin_registry.get_version()
+        if version == self._coin_maps_version:
+            return
+        
+        coins = coin_registry.get_coins_by_source(self._source)
+        self._symbol_to_coin = {coin.external_ids[self._source]: coin for coin in coins}
+        self._priority_coins = {
+            coin.id for coin in coins
+            if coin.price_priority and coin.price_priority[0] == self._source
+        }
+        source_coin_ids = {coin.id for coin in coins}
+        self._coins_with_source_count = sum(
+            1 for coin_id in self._tracked_coins if coin_id in source_coin_ids
+        )
+        self._coin_maps_version = version
+    
+    def _log_error(self, message: str, error: Exception):
+        """
+        Log error with traceback, rate-limited per exception type
+        
+        A feed sending malformed frames fails on every message; formatting
+        a traceback each time would dominate CPU, so repeats within
+        ERROR_LOG_INTERVAL are only counted.
+        """
+        error_type = type(error)
+        now = time.monotonic()
+        if now - self._error_log_times.get(error_type, float("-inf")) < self.ERROR_LOG_INTERVAL:
+            self._suppressed_errors[error_type] = self._suppressed_errors.get(error_type, 0) + 1
+            return
+        
+        self._error_log_times[error_type] = now
+        suppressed = self._suppressed_errors.pop(error_type, 0)
+        if suppressed:
+            message = f"{message} ({suppressed} similar errors suppressed)"
+        self._logger.error(f"{message}: {error}", exc_info=error)
+    
     def _get_log_prefix(self) -> str:
         """Get log prefix"""
         return f"{self._source.upper()}WebSocket"
@@ -132,24 +203,19 @@ class BaseWebSocketWorker(ABC):
         # Load coin list from config
         config_coins = self._load_coins_config()
         self._tracked_coins = set(config_coins)
+        self._coin_maps_version = None  # Tracked set changed - force maps and counts rebuild
+        self._refresh_coin_maps()
         
         if not self._tracked_coins:
             self._logger.warning("No coins to track, WebSocket not started")
             self._running = False
             return
         
-        # Determine which coins are in the source
-        coins_in_source = []
-        coins_not_in_source = []
-        for coin_id in self._tracked_coins:
-            coin = coin_registry.get_coin(coin_id)
-            if coin and self._source in coin.external_ids:
-                coins_in_source.append(coin_id)
-            else:
-                coins_not_in_source.append(coin_id)
+        coins_in_source = self._coins_with_source_count
+        coins_not_in_source = len(self._tracked_coins) - coins_in_source
         
         self._logger.info(f"Starting WebSocket worker for {len(self._tracked_coins)} coins")
-        self._logger.info(f"Tracking {len(self._tracked_coins)} coins | In {self._source}: {len(coins_in_source)} | Not in {self._source}: {len(coins_not_in_source)}")
+        self._logger.info(f"Tracking {len(self._tracked_coins)} coins | In {self._source}: {coins_in_source} | Not in {self._source}: {coins_not_in_source}")
         
         # Start WebSocket loop in background
         self._task = asyncio.create_task(self._websocket_loop())
@@ -175,57 +241,79 @@ class BaseWebSocketWorker(ABC):
         await self.stop()
     
     def _get_reconnect_delay(self, attempt: int) -> float:
-        """Calculate reconnect delay with exponential backoff and jitter."""
-        delay = min(self.RECONNECT_DELAY_INITIAL * (2 ** attempt), self.RECONNECT_DELAY_MAX)
-        jitter = delay * 0.2 * (random.random() * 2 - 1)  # +/- 20%
-        return max(1, delay + jitter)
+        """
+        Calculate reconnect delay with exponential backoff and full jitter
+        
+        Spreading delays over [0, backoff] keeps workers of several
+        deployments from reconnecting in lockstep after a network blip.
+        """
+        backoff = min(self.RECONNECT_DELAY_INITIAL * (2 ** attempt), self.RECONNECT_DELAY_MAX)
+        return random.uniform(0, backoff)
 
     async def _websocket_loop(self):
-        """Main WebSocket loop with reconnection and exponential backoff"""
+        """
+        Main WebSocket loop with reconnection and exponential backoff
+        
+        Half-open connections are detected by protocol pings (ping_timeout)
+        and by a watchdog that reconnects if no messages arrive for MESSAGE_TIMEOUT.
+        """
         ws_url = self._get_websocket_url()
         reconnect_attempt = 0
 
         while self._running:
+            connected_at: Optional[float] = None
             try:
                 self._logger.info(f"Connecting to WebSocket...")
 
-                async with websockets.connect(ws_url) as ws:
+                async with websockets.connect(
+                    ws_url,
+                    ping_interval=self.PING_INTERVAL,
+                    ping_timeout=self.PING_TIMEOUT,
+                    # Small high-rate frames: inflating them costs more than it saves
+                    compression=None,
+                    max_size=self.MAX_MESSAGE_SIZE,
+                ) as ws:
                     self._ws = ws
+                    self._redis = await get_redis()
+                    connected_at = time.monotonic()
                     self._logger.info("Connected to WebSocket")
-                    reconnect_attempt = 0  # Reset on successful connection
 
                     # Subscribe to tickers
                     await self._subscribe(ws)
 
                     # Process messages
-                    async for message in ws:
-                        if not self._running:
+                    while self._running:
+                        try:
+                            message = await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)
+                        except asyncio.TimeoutError:
+                            self._logger.warning(f"No messages for {self.MESSAGE_TIMEOUT}s, connection considered stale")
                             break
 
                         await self._process_message(message)
 
-            except websockets.exceptions.ConnectionClosed:
+            except websockets.exceptions.ConnectionClosed as e:
                 if self._running:
-                    delay = self._get_reconnect_delay(reconnect_attempt)
-                    self._logger.warning(f"Connection closed, reconnecting in {delay:.1f}s (attempt {reconnect_attempt + 1})")
-                    await asyncio.sleep(delay)
-                    reconnect_attempt += 1
-                else:
-                    break
+                    self._logger.warning(f"Connection closed: {e}")
 
             except Exception as e:
                 if self._running:
-                    delay = self._get_reconnect_delay(reconnect_attempt)
                     self._logger.error(f"WebSocket error: {e}")
-                    self._logger.info(f"Reconnecting in {delay:.1f}s (attempt {reconnect_attempt + 1})")
-                    await asyncio.sleep(delay)
-                    reconnect_attempt += 1
-                else:
-                    break
+
+            if not self._running:
+                break
+
+            # Only a connection that stayed up for a while resets the backoff
+            if connected_at is not None and time.monotonic() - connected_at >= self.STABLE_CONNECTION_TIME:
+                reconnect_attempt = 0
+
+            delay = self._get_reconnect_delay(reconnect_attempt)
+            self._logger.info(f"Reconnecting in {delay:.1f}s (attempt {reconnect_attempt + 1})")
+            await asyncio.sleep(delay)
+            reconnect_attempt += 1
 
         self._logger.info("WebSocket loop ended")
     
-    async def _process_message(self, message: str):
+    async def _process_message(self, message: Union[str, bytes]):
         """
         Process message from WebSocket
         
@@ -239,9 +327,12 @@ class BaseWebSocketWorker(ABC):
             if not tickers:
                 return
             
-            redis = await get_redis()
-            if not redis:
-                return
+            redis = self._redis
+            if redis is None:
+                # Redis was unavailable at connect time - get_redis() applies its own backoff
+                redis = self._redis = await get_redis()
+                if redis is None:
+                    return
             
             # Statistics
             updated_count = 0
@@ -249,36 +340,40 @@ class BaseWebSocketWorker(ABC):
             skipped_not_tracked = 0
             skipped_zero_price = 0
             skipped_wrong_priority = 0
-            current_time = asyncio.get_event_loop().time()
+            write_errors = 0
+            current_time = time.monotonic()
             total_tickers = len(tickers)
             
+            # Resolve coins via per-worker maps instead of scanning the registry per ticker
+            self._refresh_coin_maps()
+            symbol_to_coin = self._symbol_to_coin
+            priority_coins = self._priority_coins
+            
             # Get extractor functions
             symbol_extractor = self._get_symbol_extractor()
-            price_extractor = self._get_price_extractor()
-            price_change_extractor = self._get_price_change_extractor()
-            volume_extractor = self._get_volume_extractor()
+            values_extractor = self._get_values_extractor()
+            tracked_coins = self._tracked_coins
+            price_decimals = self._price_decimals
             
-            # Process each ticker
+            # Build payloads for each ticker
+            pending_updates = []
+            append_update = pending_updates.append
             for ticker in tickers:
                 if not isinstance(ticker, dict):
                     continue
                 
-                status, coin_id = await process_price_update(
-                    ticker=ticker,
-                    source=self._source,
-                    symbol_extractor=symbol_extractor,
-                    price_extractor=price_extractor,
-                    price_change_extractor=price_change_extractor,
-                    volume_extractor=volume_extractor,
-                    adapter_name=self._get_log_prefix(),
-                    tracked_coins=self._tracked_coins,
-                    last_update_time=self._last_update_time,
-                    coins_with_updates=self._coins_with_updates,
-                    redis=redis,
+                status, coin_id, price_data = build_price_update(
+                    ticker,
+                    symbol_to_coin,
+                    priority_coins,
+                    symbol_extractor,
+                    values_extractor,
+                    tracked_coins,
+                    price_decimals,
                 )
                 
-                if status == "updated":
-                    updated_count += 1
+                if status == "ready":
+                    append_update((coin_id, price_data))
                 elif status == "skipped_not_in_map":
                     skipped_not_in_map += 1
                 elif status == "skipped_not_tracked":
@@ -288,29 +383,60 @@ class BaseWebSocketWorker(ABC):
                 elif status == "skipped_zero_price":
                     skipped_zero_price += 1
             
-            # Log statistics periodically
-            should_log = (current_time - self._last_log_time >= self.LOG_INTERVAL)
+            # Write all prices of this message in one round-trip
+            if pending_updates:
+                pipe = redis.pipeline(transaction=False)
+                ttl = settings.CACHE_TTL_PRICE
+                dumps = orjson.dumps
+                for coin_id, price_data in pending_updates:
+                    pipe.setex("coin_price:%s" % coin_id, ttl, dumps(price_data))
+                try:
+                    results = await pipe.execute(raise_on_error=False)
+                except RedisError as e:
+                    # Connection-level failure: drop the handle so the next message re-acquires it
+                    self._redis = None
+                    self._log_error("Redis pipeline error", e)
+                    return
+                
+                last_update_time = self._last_update_time
+                move_to_end = last_update_time.move_to_end
+                for (coin_id, _), result in zip(pending_updates, results):
+                    if isinstance(result, Exception):
+                        write_errors += 1
+                        self._logger.error(f"Redis write error for {coin_id}: {result}")
+                        continue
+                    
+                    updated_count += 1
+                    last_update_time[coin_id] = current_time
+                    move_to_end(coin_id)
+                    trigger_notification_check(coin_id)
+            
+            # Log statistics periodically (recent-updates bookkeeping only feeds this log)
+            should_log = (
+                current_time - self._last_log_time >= self.LOG_INTERVAL
+                and self._logger.isEnabledFor(logging.INFO)
+            )
             
             if should_log:
                 self._last_log_time = current_time
                 
-                # Clean old entries from _coins_with_updates (older than LOG_INTERVAL seconds)
-                coins_to_remove = [
-                    coin_id for coin_id, update_time in self._last_update_time.items()
-                    if current_time - update_time > self.LOG_INTERVAL
-                ]
-                for coin_id in coins_to_remove:
-                    self._coins_with_updates.discard(coin_id)
+                # Drop coins not updated in the last LOG_INTERVAL seconds - entries are
+                # ordered by update time, so only expired ones at the head are visited
+                last_update_time = self._last_update_time
+                while last_update_time:
+                    coin_id, update_time = next(iter(last_update_time.items()))
+                    if current_time - update_time <= self.LOG_INTERVAL:
+                        break
+                    last_update_time.popitem(last=False)
                 
-                # Detailed statistics for diagnostics
-                coins_with_source = len([c for c in self._tracked_coins 
-                                        if coin_registry.get_coin(c) and self._source in coin_registry.get_coin(c).external_ids])
+                # Detailed statistics for diagnostics (counts are cached per registry version)
+                coins_with_source = self._coins_with_source_count
                 coins_not_in_source = len(self._tracked_coins) - coins_with_source
                 
                 self._logger.info(f"Updated prices: {updated_count} coins out of {total_tickers} tickers in this message")
-                self._logger.info(f"Message statistics: skipped (not in mapping: {skipped_not_in_map}, not tracked: {skipped_not_tracked}, not priority {self._source}: {skipped_wrong_priority}, price=0: {skipped_zero_price})")
+                self._logger.info(f"Message statistics: skipped (not in mapping: {skipped_not_in_map}, not tracked: {skipped_not_tracked}, not priority {self._source}: {skipped_wrong_priority}, price=0: {skipped_zero_price}), write errors: {write_errors}")
                 self._logger.info(f"Total tracking: {len(self._tracked_coins)} coins | In {self._source}: {coins_with_source} | Not in {self._source}: {coins_not_in_source}")
-                self._logger.info(f"Unique coins with updates in last {self.LOG_INTERVAL} sec: {len(self._coins_with_updates)}")
+                self._logger.info(f"Unique coins with updates in last {self.LOG_INTERVAL} sec: {len(self._last_update_time)}")
                 
         except Exception as e:
-            self._logger.error(f"Message processing error: {e}")
\ No newline at end of file
+            self._log_error("Message processing error", e)
\ No newline at end of file
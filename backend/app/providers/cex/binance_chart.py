@@ -2,6 +2,9 @@
 Binance Chart Provider
 """
 from typing import List
+
+import orjson
+
 from app.providers.base_chart import BaseChartAdapter
 
 
@@ -29,7 +32,7 @@ class BinanceChartAdapter(BaseChartAdapter):
         
         response = await client.get(url, params=params, timeout=10.0)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
 
 # Global instance
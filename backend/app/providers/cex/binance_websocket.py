@@ -3,8 +3,8 @@ Binance WebSocket Worker for real-time price updates
 
 Uses combined streams to subscribe only to tracked coins.
 """
-import json
-from typing import Dict, Optional, Callable
+from typing import Dict, Optional, Callable, Union
+import orjson
 import websockets
 
 from app.providers.base_websocket import BaseWebSocketWorker
@@ -42,14 +42,14 @@ class BinanceWebSocketWorker(BaseWebSocketWorker):
         """
         pass
 
-    def _parse_message(self, message: str) -> Optional[list]:
+    def _parse_message(self, message: Union[str, bytes]) -> Optional[list]:
         """
         Parse combined stream message from Binance.
 
         Combined stream format: {"stream": "btcusdt@ticker", "data": {ticker}}
         """
         try:
-            parsed = json.loads(message)
+            parsed = orjson.loads(message)
 
             if isinstance(parsed, dict) and "data" in parsed:
                 return [parsed["data"]]
@@ -2,6 +2,9 @@
 MEXC Chart Provider
 """
 from typing import List
+
+import orjson
+
 from app.providers.base_chart import BaseChartAdapter
 
 
@@ -38,7 +41,7 @@ class MEXCChartAdapter(BaseChartAdapter):
         
         response = await client.get(url, params=params, timeout=15.0)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
 
 # Global instance
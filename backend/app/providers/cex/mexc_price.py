@@ -15,18 +15,7 @@ class MEXCPriceAdapter(BasePriceAdapter):
         return await self._get_price_from_redis(coin_id, "mexc", "MEXCPriceAdapter")
     
     async def get_prices(self, coin_ids: List[str]) -> Dict[str, Dict]:
-        result = {}
-        
-        # Get all prices in parallel
-        import asyncio
-        tasks = [self.get_price(coin_id) for coin_id in coin_ids]
-        prices = await asyncio.gather(*tasks)
-        
-        for coin_id, price_data in zip(coin_ids, prices):
-            if price_data:
-                result[coin_id] = price_data
-        
-        return result
+        return await self._get_prices_from_redis(coin_ids, "mexc", "MEXCPriceAdapter")
     
     def is_available(self, coin_id: str) -> bool:
         return coin_registry.find_coin_by_external_id("mexc", coin_id) is not None
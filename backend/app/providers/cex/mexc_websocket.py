@@ -5,7 +5,7 @@ Uses protobuf messages for miniTickers channel.
 """
 import json
 import asyncio
-from typing import Dict, Optional, Callable, List
+from typing import Dict, Optional, Callable, List, Union
 import websockets
 
 from app.providers.base_websocket import BaseWebSocketWorker
@@ -37,7 +37,7 @@ class MEXCWebSocketWorker(BaseWebSocketWorker):
         await ws.send(json.dumps(subscribe_msg))
         self._logger.info("Subscribed to MEXC miniTickers channel")
     
-    def _parse_message(self, message: str) -> Optional[list]:
+    def _parse_message(self, message: Union[str, bytes]) -> Optional[list]:
         """
         Parse message from MEXC and extract tickers.
         
@@ -83,10 +83,10 @@ class MEXCWebSocketWorker(BaseWebSocketWorker):
                 return None
                 
         except Exception as e:
-            self._logger.error(f"Protobuf parsing error: {e}", exc_info=True)
+            self._log_error("Protobuf parsing error", e)
             return None
     
-    async def _process_message(self, message: str):
+    async def _process_message(self, message: Union[str, bytes]):
         """
         Override to handle ping/pong messages before parsing.
         """
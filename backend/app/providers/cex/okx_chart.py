@@ -2,6 +2,9 @@
 OKX Chart Provider
 """
 from typing import List, Dict
+
+import orjson
+
 from app.providers.base_chart import BaseChartAdapter
 
 
@@ -37,7 +40,7 @@ class OKXChartAdapter(BaseChartAdapter):
         
         response = await client.get(url, params=params, timeout=30.0)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
         # Check OKX response code
         if data.get("code") != "0":
@@ -5,11 +5,11 @@ Uses public tickers channel to get all tickers.
 Updates Redis cache with coin_price:{coin_id} keys for compatibility.
 """
 import json
-from typing import Dict, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple, Union
+import orjson
 import websockets
 
 from app.providers.base_websocket import BaseWebSocketWorker
-from app.core.coin_registry import coin_registry
 
 
 class OKXWebSocketWorker(BaseWebSocketWorker):
@@ -20,11 +20,46 @@ class OKXWebSocketWorker(BaseWebSocketWorker):
     
     def __init__(self):
         super().__init__(source="okx")
+        self._subscribe_payloads: List[str] = []
+        self._subscribe_payloads_count = 0
+        self._subscribe_payloads_version: Optional[int] = None
     
     def _get_websocket_url(self) -> str:
         """Get URL for WebSocket connection"""
         return self.OKX_WS_URL
     
+    def _build_subscribe_payloads(self) -> List[str]:
+        """
+        Build serialized subscribe messages for OKX symbols of tracked priority coins
+        
+        Payloads are cached per registry version, so reconnects resend
+        ready-made strings instead of re-serializing argument dicts.
+        """
+        self._refresh_coin_maps()
+        if self._subscribe_payloads_version == self._coin_maps_version:
+            return self._subscribe_payloads
+        
+        # Tickers of coins without OKX as first price priority would be discarded
+        # on arrival, so don't subscribe to them at all
+        okx_symbols = [
+            symbol for symbol, coin in self._symbol_to_coin.items()
+            if coin.id in self._tracked_coins and coin.id in self._priority_coins
+        ]
+        
+        payloads = []
+        for i in range(0, len(okx_symbols), self.MAX_SUBSCRIPTIONS_PER_REQUEST):
+            batch = okx_symbols[i:i + self.MAX_SUBSCRIPTIONS_PER_REQUEST]
+            fragments = ",".join(
+                '{"channel":"tickers","instId":' + json.dumps(symbol) + '}'
+                for symbol in batch
+            )
+            payloads.append('{"op":"subscribe","args":[' + fragments + ']}')
+        
+        self._subscribe_payloads = payloads
+        self._subscribe_payloads_count = len(okx_symbols)
+        self._subscribe_payloads_version = self._coin_maps_version
+        return payloads
+    
     async def _subscribe(self, ws: websockets.WebSocketClientProtocol):
         """
         Subscribe to OKX tickers
@@ -32,37 +67,22 @@ class OKXWebSocketWorker(BaseWebSocketWorker):
         OKX requires explicit subscription for each ticker.
         Format: {"op": "subscribe", "args": [{"channel": "tickers", "instId": "BTC-USDT"}, ...]}
         """
-        # Get all OKX symbols for tracked coins
-        okx_symbols = []
-        for coin_id in self._tracked_coins:
-            coin = coin_registry.get_coin(coin_id)
-            if coin and "okx" in coin.external_ids:
-                okx_symbols.append(coin.external_ids["okx"])
+        payloads = self._build_subscribe_payloads()
         
-        if not okx_symbols:
+        if not payloads:
             self._logger.warning("No OKX symbols to subscribe to")
             return
         
         # Subscribe in batches (OKX has limit on number of subscriptions per request)
-        total_subscribed = 0
-        for i in range(0, len(okx_symbols), self.MAX_SUBSCRIPTIONS_PER_REQUEST):
-            batch = okx_symbols[i:i + self.MAX_SUBSCRIPTIONS_PER_REQUEST]
-            subscribe_args = [
-                {"channel": "tickers", "instId": symbol}
-                for symbol in batch
-            ]
-            
-            subscribe_msg = {
-                "op": "subscribe",
-                "args": subscribe_args
-            }
+        total_symbols = self._subscribe_payloads_count
+        for i, payload in enumerate(payloads):
+            # Sent as str: OKX only accepts text frames
+            await ws.send(payload)
             
-            await ws.send(json.dumps(subscribe_msg))
-            total_subscribed += len(subscribe_args)
-            
-            self._logger.info(f"Subscribed to {len(subscribe_args)} tickers (total: {total_subscribed}/{len(okx_symbols)})")
+            subscribed = min((i + 1) * self.MAX_SUBSCRIPTIONS_PER_REQUEST, total_symbols)
+            self._logger.info(f"Subscribed to tickers batch {i + 1}/{len(payloads)} (total: {subscribed}/{total_symbols})")
     
-    def _parse_message(self, message: str) -> Optional[list]:
+    def _parse_message(self, message: Union[str, bytes]) -> Optional[list]:
         """
         Parse message from OKX and extract tickers
         
@@ -71,7 +91,7 @@ class OKXWebSocketWorker(BaseWebSocketWorker):
         - Ticker data: {"data": [{...}, {...}], "arg": {...}}
         """
         try:
-            data = json.loads(message)
+            data = orjson.loads(message)
             
             # Handle subscription events
             if data.get("event") == "subscribe":
@@ -86,7 +106,7 @@ class OKXWebSocketWorker(BaseWebSocketWorker):
             return None
             
         except Exception as e:
-            self._logger.error(f"Message parsing error: {e}", exc_info=True)
+            self._log_error("Message parsing error", e)
             return None
     
     def _get_symbol_extractor(self) -> Callable[[Dict], Optional[str]]:
@@ -116,5 +136,22 @@ class OKXWebSocketWorker(BaseWebSocketWorker):
     def _get_volume_extractor(self) -> Callable[[Dict], float]:
         """Extract 24h volume from OKX ticker"""
         return lambda t: float(t.get("vol24h", 0))
+    
+    def _get_values_extractor(self) -> Callable[[Dict], Tuple[float, float, float]]:
+        """
+        Extract price, 24h change and volume from OKX ticker in one pass
+        
+        "last" is parsed once and reused for the change calculation.
+        """
+        _float = float
+        
+        def extractor(t: Dict) -> Tuple[float, float, float]:
+            get = t.get
+            price = _float(get("last", 0))
+            open_24h = _float(get("open24h", 0))
+            price_change = ((price - open_24h) / open_24h) * 100 if open_24h > 0 else 0.0
+            return price, price_change, _float(get("vol24h", 0))
+        
+        return extractor
 
 okx_websocket_worker = OKXWebSocketWorker()
\ No newline at end of file
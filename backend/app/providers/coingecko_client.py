@@ -2,13 +2,17 @@
 CoinGecko HTTP Client
 
 HTTP client for working with CoinGecko API.
+Requests go through the shared HTTP client, so all CoinGecko adapters
+reuse one connection pool.
 """
 import asyncio
 import httpx
 import logging
-from typing import Dict, Any, Optional
+import orjson
+from typing import Dict, Any
 
 from app.core.config import settings
+from app.utils.http_client import SharedHTTPClient
 
 logger = logging.getLogger(__name__)
 
@@ -22,22 +26,11 @@ class CoinGeckoClient:
         if self.api_key:
             self.headers["x-cg-demo-api-key"] = self.api_key
         
-        # HTTP client is created lazily on first request
-        self._client: Optional[httpx.AsyncClient] = None
-    
     async def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                headers=self.headers,
-                timeout=30.0
-            )
-        return self._client
+        return SharedHTTPClient.get_client()
     
     async def close(self):
-        """Close HTTP client"""
-        if self._client is not None:
-            await self._client.aclose()
-            self._client = None
+        """Nothing to release: the shared HTTP client is closed on application shutdown"""
     
     async def get(
         self,
@@ -49,9 +42,9 @@ class CoinGeckoClient:
         client = await self._get_client()
         
         try:
-            response = await client.get(url, params=params or {})
+            response = await client.get(url, params=params or {}, headers=self.headers)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
             
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 429 and retry_on_rate_limit:
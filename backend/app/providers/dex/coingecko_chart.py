@@ -6,11 +6,11 @@ Fetches historical price data via /coins/{id}/market_chart endpoint.
 """
 import logging
 from typing import List, Dict, Optional
-from datetime import datetime, timezone
 
 from app.providers.base_chart import BaseChartAdapter
 from app.providers.coingecko_client import CoinGeckoClient
 from app.core.coin_registry import coin_registry
+from app.utils.formatters import format_chart_dates
 
 logger = logging.getLogger(__name__)
 
@@ -90,29 +90,16 @@ class CoinGeckoChartAdapter(BaseChartAdapter):
             # Create a map of timestamp -> volume for quick lookup
             volume_map = {vol[0]: vol[1] for vol in volumes}
             
-            # Process data points
-            chart_data = []
-            for price_point in prices:
-                timestamp_ms = price_point[0]
-                price = float(price_point[1])
-                
-                # Get volume for this timestamp (or 0 if not found)
-                volume = float(volume_map.get(timestamp_ms, 0))
-                
-                # Convert timestamp from milliseconds to seconds
-                timestamp_seconds = timestamp_ms / 1000
-                
-                # Create datetime in UTC
-                date_obj = datetime.fromtimestamp(timestamp_seconds, tz=timezone.utc)
-                
-                # Return in ISO format with timezone
-                date_str = date_obj.isoformat()
-                
-                chart_data.append({
+            # Process data points (dates are formatted for all points at once)
+            dates = format_chart_dates([price_point[0] for price_point in prices])
+            chart_data = [
+                {
                     "date": date_str,
-                    "price": price,
-                    "volume": volume,
-                })
+                    "price": float(price_point[1]),
+                    "volume": float(volume_map.get(price_point[0], 0)),
+                }
+                for date_str, price_point in zip(dates, prices)
+            ]
             
             # Sort by date
             chart_data.sort(key=lambda x: x["date"])
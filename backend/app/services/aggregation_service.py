@@ -4,11 +4,17 @@ AggregationService - data aggregation from different providers
 Centralized service for getting coin data from different sources
 with priority and fallback mechanisms.
 """
-from typing import Dict, List, Optional
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
 import asyncio
 import logging
 
-from app.core.coin_registry import coin_registry
+import numpy as np
+
+from app.core.config import settings
+from app.core.coin_registry import CoinConfig, coin_registry
 from app.providers.coingecko_static import coingecko_static_adapter
 from app.providers.dex.coingecko_price import coingecko_price_adapter
 from app.providers.dex.coingecko_chart import coingecko_chart_adapter
@@ -18,201 +24,575 @@ from app.providers.cex.mexc_price import mexc_price_adapter
 from app.providers.cex.binance_chart import binance_chart_adapter
 from app.providers.cex.okx_chart import okx_chart_adapter
 from app.providers.cex.mexc_chart import mexc_chart_adapter
-from app.utils.cache import CoinCacheManager
+from app.utils.cache import CoinCacheManager, TTLCache
+from app.utils.circuit_breaker import CircuitBreaker
+
+
+# Provider registry (fixed at import time)
+_STATIC_PROVIDERS = MappingProxyType({
+    "coingecko": coingecko_static_adapter,
+})
+
+_PRICE_PROVIDERS = MappingProxyType({
+    "binance": binance_price_adapter,
+    "okx": okx_price_adapter,
+    "mexc": mexc_price_adapter,
+    "coingecko": coingecko_price_adapter,
+})
+
+_CHART_PROVIDERS = MappingProxyType({
+    "binance": binance_chart_adapter,
+    "okx": okx_chart_adapter,
+    "mexc": mexc_chart_adapter,
+    "coingecko": coingecko_chart_adapter,
+})
+
+# All registries by data kind - the single place where adapters are registered
+PROVIDERS_CONFIG = MappingProxyType({
+    "static": _STATIC_PROVIDERS,
+    "price": _PRICE_PROVIDERS,
+    "chart": _CHART_PROVIDERS,
+})
+
+
+@lru_cache(maxsize=64)
+def _chart_provider_order(priority: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Chart providers in price_priority order, followed by all others as fallback"""
+    priority = tuple(dict.fromkeys(priority))
+    fallback = tuple(name for name in _CHART_PROVIDERS if name not in priority)
+    return tuple(chain(priority, fallback))
 
 
 class AggregationService:
     
+    __slots__ = (
+        "cache",
+        "_logger",
+        "_static_cache",
+        "_image_url_cache",
+        "_price_misses",
+        "_chart_arrays_cache",
+        "_price_breakers",
+        "_chart_breakers",
+        "_price_plans",
+        "_chart_plans",
+        "_plans_version",
+        "_inflight",
+        "_price_semaphore",
+    )
+    
+    static_providers = _STATIC_PROVIDERS
+    price_providers = _PRICE_PROVIDERS
+    chart_providers = _CHART_PROVIDERS
+    
+    CHART_HEDGE_DELAY = 0.5  # Seconds before starting the next chart provider in parallel
+    
+    # Latency budgets (seconds): per provider attempt and for the whole request
+    PRICE_PER_PROVIDER_TIMEOUT = 1.5
+    PRICE_TOTAL_BUDGET = 4.0
+    CHART_PER_PROVIDER_TIMEOUT = 3.0
+    CHART_TOTAL_BUDGET = 8.0
+    
+    # Max price fetches in flight, kept below the shared HTTP pool size
+    MAX_CONCURRENT_PRICE_FETCHES = 64
+    
     def __init__(self):
         self.cache = CoinCacheManager()
+        # In-process caches for rarely changing data, in front of Redis
+        self._static_cache = TTLCache(ttl=settings.CACHE_TTL_STATIC)
+        self._image_url_cache = TTLCache(ttl=settings.CACHE_TTL_IMAGE)
+        # Coins no provider had a price for recently, so repeated misses
+        # don't walk every provider again
+        self._price_misses = TTLCache(ttl=settings.CACHE_TTL_PRICE_MISS)
+        # Charts already converted to arrays, kept as long as the chart itself
+        self._chart_arrays_cache = TTLCache(ttl=settings.CACHE_TTL_CHART, maxsize=256)
         self._logger = logging.getLogger(__name__)
         
-        # Provider registry
-        self.static_providers = {
-            "coingecko": coingecko_static_adapter,
+        # Circuit breakers per provider, separate for prices and charts
+        # since they hit different backends (cache vs exchange REST API)
+        self._price_breakers = {
+            name: self._create_breaker(f"price:{name}") for name in _PRICE_PROVIDERS
         }
-        
-        self.price_providers = {
-            "binance": binance_price_adapter,
-            "okx": okx_price_adapter,
-            "mexc": mexc_price_adapter,
-            "coingecko": coingecko_price_adapter,
+        self._chart_breakers = {
+            name: self._create_breaker(f"chart:{name}") for name in _CHART_PROVIDERS
         }
         
-        self.chart_providers = {
-            "binance": binance_chart_adapter,
-            "okx": okx_chart_adapter,
-            "mexc": mexc_chart_adapter,
-            "coingecko": coingecko_chart_adapter,
-        }
+        # Per-coin provider plans, rebuilt when the registry changes
+        self._price_plans: Dict[str, Tuple[Tuple[str, object, str, CircuitBreaker], ...]] = {}
+        self._chart_plans: Dict[str, Tuple[Tuple[str, object, str, CircuitBreaker], ...]] = {}
+        self._plans_version: Optional[int] = None
+        
+        # Fetches in progress, so concurrent identical requests share one upstream call
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._price_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_PRICE_FETCHES)
+    
+    @staticmethod
+    def _create_breaker(name: str) -> CircuitBreaker:
+        return CircuitBreaker(
+            name,
+            failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+            sleep_window=settings.CIRCUIT_BREAKER_SLEEP_WINDOW,
+            error_percentage=settings.CIRCUIT_BREAKER_ERROR_PERCENTAGE,
+        )
+    
+    def _refresh_plans(self):
+        """
+        Precompute ordered (provider_name, provider, external_id, breaker) plans per coin
+        
+        Price plan follows price_priority; chart plan is price_priority followed by
+        all other chart providers as fallback. Providers without an external ID
+        for the coin or not available for it are left out. Availability is derived
+        from the coin registry only, so it is checked here, once per registry
+        version, instead of on every request.
+        """
+        version = coin_registry.get_version()
+        if version == self._plans_version:
+            return
+        
+        price_providers = _PRICE_PROVIDERS
+        chart_providers = _CHART_PROVIDERS
+        price_breakers = self._price_breakers
+        chart_breakers = self._chart_breakers
+        
+        price_plans = {}
+        chart_plans = {}
+        for coin in coin_registry.get_all_coins(enabled_only=False):
+            external_ids = coin.external_ids
+            price_plans[coin.id] = tuple(
+                (name, price_providers[name], external_ids[name], price_breakers[name])
+                for name in coin.price_priority
+                if name in price_providers
+                and external_ids.get(name)
+                and price_providers[name].is_available(external_ids[name])
+            )
+            chart_plans[coin.id] = tuple(
+                (name, chart_providers[name], external_ids[name], chart_breakers[name])
+                for name in _chart_provider_order(tuple(coin.price_priority))
+                if name in chart_providers
+                and external_ids.get(name)
+                and chart_providers[name].is_available(external_ids[name])
+            )
+        
+        self._price_plans = price_plans
+        self._chart_plans = chart_plans
+        self._plans_version = version
+    
+    def _single_flight(self, key: Hashable, fetch: Callable[[], Awaitable]) -> Awaitable:
+        """
+        Run fetch() once per key among concurrent callers
+        
+        The fetch runs as a separate task, so a cancelled caller doesn't
+        cancel it for the others still waiting.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(fetch())
+            self._inflight[key] = task
+            
+            def _on_done(t: asyncio.Task):
+                self._inflight.pop(key, None)
+                if not t.cancelled():
+                    t.exception()  # Mark as retrieved if every caller went away
+            
+            task.add_done_callback(_on_done)
+        return asyncio.shield(task)
     
     async def get_coin_static_data(self, coin_id: str) -> Optional[Dict]:
         coin = coin_registry.get_coin(coin_id)
         if not coin:
             return None
-        
+        return await self._get_static_for_coin(coin)
+    
+    async def _get_static_for_coin(self, coin: CoinConfig) -> Optional[Dict]:
+        """Static data for an already resolved coin"""
         # Use CoinGecko for static data
         coingecko_id = coin.external_ids.get("coingecko")
         if not coingecko_id:
             return None
         
-        return await self.static_providers["coingecko"].get_coin_static_data(coingecko_id)
+        static_data = self._static_cache.get(coin.id)
+        if static_data is not None:
+            return static_data
+        
+        static_data = await _STATIC_PROVIDERS["coingecko"].get_coin_static_data(coingecko_id)
+        if static_data:
+            self._static_cache.set(coin.id, static_data)
+        return static_data
     
     async def get_coins_static_data(self, coin_ids: List[str]) -> Dict[str, Dict]:
         # Get CoinGecko IDs for all coins
-        coingecko_ids = []
-        coin_id_map = {}  # coingecko_id -> internal_id
+        get_coin = coin_registry.get_coin
+        pairs = [
+            (coin.external_ids.get("coingecko"), coin_id)
+            for coin_id in coin_ids
+            if (coin := get_coin(coin_id))
+        ]
+        coin_id_map = {coingecko_id: coin_id for coingecko_id, coin_id in pairs if coingecko_id}  # coingecko_id -> internal_id
         
-        for coin_id in coin_ids:
-            coin = coin_registry.get_coin(coin_id)
-            if coin:
-                coingecko_id = coin.external_ids.get("coingecko")
-                if coingecko_id:
-                    coingecko_ids.append(coingecko_id)
-                    coin_id_map[coingecko_id] = coin_id
+        # Serve what we can from memory, request only the rest
+        result = {}
+        coingecko_ids = []
+        for coingecko_id, coin_id in coin_id_map.items():
+            cached = self._static_cache.get(coin_id)
+            if cached is not None:
+                result[coin_id] = cached
+            else:
+                coingecko_ids.append(coingecko_id)
         
         if not coingecko_ids:
-            return {}
+            return result
         
         # Get static data from CoinGecko
-        static_data = await self.static_providers["coingecko"].get_coins_static_data(coingecko_ids)
+        static_data = await _STATIC_PROVIDERS["coingecko"].get_coins_static_data(coingecko_ids)
         
         # Convert back to internal_id
-        result = {}
         for coingecko_id, data in static_data.items():
             internal_id = coin_id_map.get(coingecko_id)
-            if internal_id:
+            if internal_id and data:
                 result[internal_id] = data
+                self._static_cache.set(internal_id, data)
         
         return result
     
     async def get_coin_price(self, coin_id: str) -> Optional[Dict]:
-        coin = coin_registry.get_coin(coin_id)
-        if not coin:
+        self._refresh_plans()
+        plan = self._price_plans.get(coin_id)
+        if not plan or self._price_misses.get(coin_id):
             return None
         
-        # Get provider list in priority order
-        providers = coin.price_priority
+        return await self._single_flight(
+            ("price", coin_id),
+            lambda: self._fetch_coin_price(coin_id, plan),
+        )
+    
+    async def _fetch_coin_price(self, coin_id: str, plan: tuple) -> Optional[Dict]:
+        # Plan is already specialized per coin (only providers that can serve it,
+        # in priority order), so the loop only binds what it uses per iteration
+        now = asyncio.get_running_loop().time
+        wait_for = asyncio.wait_for
+        per_provider_timeout = self.PRICE_PER_PROVIDER_TIMEOUT
+        deadline = now() + self.PRICE_TOTAL_BUDGET
+        all_answered = True  # every provider answered, none failed or was skipped
         
-        # Try to get price from each provider in order
-        for provider_name in providers:
-            provider = self.price_providers.get(provider_name)
-            if not provider:
-                continue
+        # Try to get price from each provider in priority order
+        for provider_name, provider, external_id, breaker in plan:
+            remaining = deadline - now()
+            if remaining <= 0:
+                self._logger.warning("Price budget exhausted for %s", coin_id)
+                all_answered = False
+                break
             
-            # Get external ID for this provider
-            external_id = coin.external_ids.get(provider_name)
-            if not external_id:
+            # Skip providers that keep failing
+            if not breaker.allow():
+                all_answered = False
                 continue
             
-            # Check availability
-            if not provider.is_available(external_id):
+            # Try to get price. A missing price is a per-coin cache miss rather than
+            # a provider failure, so only exceptions and timeouts count against the breaker
+            try:
+                price_data = await wait_for(
+                    provider.get_price(external_id),
+                    timeout=min(per_provider_timeout, remaining),
+                )
+            except asyncio.TimeoutError:
+                breaker.record_failure()
+                self._logger.warning("Timeout getting price from %s for %s", provider_name, coin_id)
+                all_answered = False
+                continue
+            except Exception as e:
+                breaker.record_failure()
+                self._logger.error("Error getting price from %s for %s: %s", provider_name, coin_id, e)
+                all_answered = False
                 continue
             
-            # Try to get price
-            price_data = await provider.get_price(external_id)
+            breaker.record_success()
             if price_data:
                 return price_data
         
-        # If no provider returned price, return None
+        # Remember the miss only if every provider answered without a price;
+        # failures and skipped providers may still have it on the next request
+        if all_answered:
+            self._price_misses.set(coin_id, True)
         return None
     
     async def get_coins_prices(self, coin_ids: List[str]) -> Dict[str, Dict]:
-        # Get prices in parallel
-        tasks = [self.get_coin_price(coin_id) for coin_id in coin_ids]
-        prices = await asyncio.gather(*tasks)
-        
+        # Fetch in priority rounds: each round groups the coins still without
+        # a price by their next provider, so every provider gets one batch call
+        # per round instead of one call per coin
+        self._refresh_plans()
+        price_plans = self._price_plans
+        price_misses = self._price_misses
+        remaining = [
+            coin_id for coin_id in dict.fromkeys(coin_ids)
+            if price_plans.get(coin_id) and not price_misses.get(coin_id)
+        ]
         result = {}
-        for coin_id, price_data in zip(coin_ids, prices):
-            if price_data:
-                result[coin_id] = price_data
+        failed = set()  # coins a provider could not answer for
+        round_index = 0
+        
+        # All rounds share one total budget, like the single-coin path
+        try:
+            async with asyncio.timeout(self.PRICE_TOTAL_BUDGET):
+                while remaining:
+                    groups: Dict[str, List[Tuple[str, str]]] = {}  # provider -> [(coin_id, external_id)]
+                    for coin_id in remaining:
+                        plan = price_plans[coin_id]
+                        if round_index < len(plan):
+                            provider_name, _, external_id, _ = plan[round_index]
+                            groups.setdefault(provider_name, []).append((coin_id, external_id))
+                    
+                    if not groups:
+                        break
+                    
+                    async with asyncio.TaskGroup() as tg:
+                        tasks = [
+                            (pairs, tg.create_task(self._get_provider_prices_bounded(provider_name, pairs)))
+                            for provider_name, pairs in groups.items()
+                        ]
+                    for pairs, task in tasks:
+                        prices = task.result()
+                        if prices is None:
+                            failed.update(coin_id for coin_id, _ in pairs)
+                        else:
+                            result.update(prices)
+                    
+                    remaining = [coin_id for coin_id in remaining if coin_id not in result]
+                    round_index += 1
+        except TimeoutError:
+            remaining = [coin_id for coin_id in remaining if coin_id not in result]
+            self._logger.warning("Price budget exhausted for %d coins", len(remaining))
+        
+        # Remember misses only for coins every provider answered without a price
+        # (after a timeout round_index is the unfinished round)
+        for coin_id in remaining:
+            if coin_id not in failed and len(price_plans[coin_id]) <= round_index:
+                price_misses.set(coin_id, True)
         
         return result
     
+    async def _get_provider_prices_bounded(
+        self,
+        provider_name: str,
+        pairs: List[Tuple[str, str]],
+    ) -> Optional[Dict[str, Dict]]:
+        """_get_provider_prices limited by the shared price fetch semaphore"""
+        async with self._price_semaphore:
+            return await self._get_provider_prices(provider_name, pairs)
+    
+    async def _get_provider_prices(
+        self,
+        provider_name: str,
+        pairs: List[Tuple[str, str]],
+    ) -> Optional[Dict[str, Dict]]:
+        """
+        Batch-fetch prices from one provider, keyed by internal coin ID
+        
+        Returns None if the provider could not answer (open circuit, timeout
+        or error), so callers can tell a failure from coins without a price.
+        """
+        provider = _PRICE_PROVIDERS[provider_name]
+        breaker = self._price_breakers[provider_name]
+        
+        # Pairs come from price plans, so every coin is available on this provider
+        if not pairs:
+            return {}
+        if not breaker.allow():
+            return None
+        
+        try:
+            prices = await asyncio.wait_for(
+                provider.get_prices([external_id for _, external_id in pairs]),
+                timeout=self.PRICE_PER_PROVIDER_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            breaker.record_failure()
+            self._logger.warning("Timeout getting batch prices from %s", provider_name)
+            return None
+        except Exception as e:
+            breaker.record_failure()
+            self._logger.error("Error getting batch prices from %s: %s", provider_name, e)
+            return None
+        
+        breaker.record_success()
+        return {
+            coin_id: prices[external_id]
+            for coin_id, external_id in pairs
+            if prices.get(external_id)
+        }
+    
     async def get_coin_chart(
         self,
         coin_id: str,
         period: str = "7d"
     ) -> Optional[List[Dict]]:
-        coin = coin_registry.get_coin(coin_id)
-        if not coin:
+        self._refresh_plans()
+        plan = self._chart_plans.get(coin_id)
+        if plan is None:
             return None
         
         # Check cache
         cached_data = await self.cache.get_chart(coin_id, period)
-        if cached_data:
-            self._logger.info(f"Chart loaded from CACHE for {coin_id} ({period}): {len(cached_data)} points")
+        if cached_data is not None:
+            if not cached_data:
+                # Negative entry: no provider had this chart a moment ago
+                return None
+            if self._logger.isEnabledFor(logging.INFO):
+                self._logger.info("Chart loaded from CACHE for %s (%s): %d points", coin_id, period, len(cached_data))
             return cached_data
         
-        # Get provider list in priority order
-        providers = coin.price_priority  # Use same providers as for prices
+        return await self._single_flight(
+            ("chart", coin_id, period),
+            lambda: self._fetch_coin_chart(coin_id, period, plan),
+        )
+    
+    async def get_coin_chart_arrays(
+        self,
+        coin_id: str,
+        period: str = "7d"
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Get coin chart as parallel arrays for vectorized consumers
         
-        # Try to get chart from each provider in order
-        for provider_name in providers:
-            provider = self.chart_providers.get(provider_name)
-            if not provider:
-                self._logger.warning(f"Provider {provider_name} not found for {coin_id}")
-                continue
-            
-            # Get external ID for this provider
-            external_id = coin.external_ids.get(provider_name)
-            if not external_id:
-                self._logger.warning(f"Coin {coin_id} doesn't have external ID for provider {provider_name}")
-                continue
-            
-            # Check availability
-            if not provider.is_available(external_id):
-                self._logger.warning(f"Provider {provider_name} is unavailable for {external_id}")
-                continue
-            
-            # Try to get chart
-            try:
-                chart_data = await provider.get_chart_data(external_id, period)
-                if chart_data:
-                    # Save to cache (if provider hasn't already saved)
-                    await self.cache.set_chart(coin_id, period, chart_data)
-                    self._logger.info(f"Chart loaded from {provider_name.upper()} for {coin_id} ({period}): {len(chart_data)} points")
-                    return chart_data
-                else:
-                    self._logger.warning(f"Provider {provider_name} returned empty data for {coin_id}")
-            except Exception as e:
-                self._logger.error(f"Error getting chart from {provider_name} for {coin_id}: {e}")
-                continue
+        Returns:
+            Tuple (timestamps, prices): UTC timestamps in milliseconds (int64)
+            and prices (float64), oldest first; None if there is no chart.
+            Arrays are shared between callers and are read-only.
+        """
+        key = (coin_id, period)
+        arrays = self._chart_arrays_cache.get(key)
+        if arrays is not None:
+            return arrays
         
-        # If none of the providers from price_priority returned chart, try all available providers as fallback
-        self._logger.info(f"Trying fallback to all available providers for {coin_id}")
-        all_available_providers = list(self.chart_providers.keys())
+        chart_data = await self.get_coin_chart(coin_id, period)
+        if not chart_data:
+            return None
         
-        for provider_name in all_available_providers:
-            # Skip providers already tried above
-            if provider_name in providers:
-                continue
-            
-            provider = self.chart_providers.get(provider_name)
-            if not provider:
-                continue
-            
-            external_id = coin.external_ids.get(provider_name)
-            if not external_id:
-                continue
-            
-            if not provider.is_available(external_id):
+        # Dates are "YYYY-MM-DDTHH:MM:SS+00:00", the offset is always UTC
+        timestamps = (
+            np.array([point["date"][:19] for point in chart_data], dtype="datetime64[s]")
+            .astype("datetime64[ms]")
+            .astype(np.int64)
+        )
+        prices = np.fromiter(
+            (point["price"] for point in chart_data), dtype=np.float64, count=len(chart_data)
+        )
+        timestamps.setflags(write=False)
+        prices.setflags(write=False)
+        
+        arrays = (timestamps, prices)
+        self._chart_arrays_cache.set(key, arrays)
+        return arrays
+    
+    async def _fetch_coin_chart(self, coin_id: str, period: str, plan: tuple) -> Optional[List[Dict]]:
+        # Per-provider outcomes, logged as a single line at the end of the request
+        events: List[Tuple[str, str]] = []
+        
+        # Providers from price_priority first, then all other chart providers as fallback
+        eligible = []
+        for provider_name, provider, external_id, breaker in plan:
+            # Skip providers that keep failing
+            if not breaker.allow():
+                events.append((provider_name, "circuit_open"))
                 continue
             
-            try:
-                chart_data = await provider.get_chart_data(external_id, period)
-                if chart_data:
-                    await self.cache.set_chart(coin_id, period, chart_data)
-                    self._logger.info(f"Fallback successful: chart loaded from {provider_name.upper()} for {coin_id} ({period}): {len(chart_data)} points")
-                    return chart_data
-            except Exception as e:
-                self._logger.error(f"Fallback error from {provider_name} for {coin_id}: {e}")
-                continue
+            eligible.append((provider_name, provider, external_id))
         
-        # If no provider returned chart, return None
-        self._logger.error(f"No chart found for {coin_id} ({period}) from any provider.")
+        provider_name, chart_data = await self._race_chart_providers(coin_id, period, eligible, events)
+        if chart_data:
+            # Save to cache (if provider hasn't already saved)
+            await self.cache.set_chart(coin_id, period, chart_data)
+            if self._logger.isEnabledFor(logging.INFO):
+                self._logger.info(
+                    "chart_fetch coin_id=%s period=%s chosen=%s points=%d events=%s",
+                    coin_id, period, provider_name, len(chart_data), events,
+                )
+            return chart_data
+        
+        # If no provider returned chart, cache the miss briefly and return None.
+        # Only when every provider answered empty: open circuits, timeouts,
+        # errors and an exhausted budget say nothing about the coin itself
+        self._logger.error(
+            "chart_fetch coin_id=%s period=%s chosen=None points=0 events=%s",
+            coin_id, period, events,
+        )
+        if events and all(outcome == "empty" for _, outcome in events):
+            await self.cache.set_chart(coin_id, period, [], ttl=settings.CACHE_TTL_CHART_MISS)
         return None
     
+    async def _race_chart_providers(
+        self,
+        coin_id: str,
+        period: str,
+        eligible: List[Tuple[str, object, str]],
+        events: List[Tuple[str, str]],
+    ) -> Tuple[Optional[str], Optional[List[Dict]]]:
+        """
+        Fetch chart from eligible providers with hedged requests
+        
+        Providers are started in priority order; the next one is started when
+        the previous fails or hasn't answered within CHART_HEDGE_DELAY. The first
+        non-empty result wins (priority breaks ties) and the rest are cancelled.
+        Outcome of every finished attempt is appended to events.
+        
+        Returns:
+            Tuple (provider_name, chart_data) or (None, None)
+        """
+        task_info = {}  # task -> (priority index, provider_name)
+        pending = set()
+        next_index = 0
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.CHART_TOTAL_BUDGET
+        
+        try:
+            while next_index < len(eligible) or pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    events.append(("*", "budget_exhausted"))
+                    break
+                
+                if next_index < len(eligible):
+                    provider_name, provider, external_id = eligible[next_index]
+                    task = asyncio.create_task(asyncio.wait_for(
+                        provider.get_chart_data(external_id, period),
+                        timeout=min(self.CHART_PER_PROVIDER_TIMEOUT, remaining),
+                    ))
+                    task_info[task] = (next_index, provider_name)
+                    pending.add(task)
+                    next_index += 1
+                
+                timeout = min(self.CHART_HEDGE_DELAY, remaining) if next_index < len(eligible) else remaining
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                
+                for task in sorted(done, key=lambda t: task_info[t][0]):
+                    _, provider_name = task_info[task]
+                    breaker = self._chart_breakers[provider_name]
+                    
+                    error = task.exception()
+                    if isinstance(error, asyncio.TimeoutError):
+                        breaker.record_failure()
+                        events.append((provider_name, "timeout"))
+                        continue
+                    
+                    # Adapters report request errors as empty data
+                    if error is not None:
+                        breaker.record_failure()
+                        events.append((provider_name, "error: %s" % error))
+                        continue
+                    
+                    chart_data = task.result()
+                    if chart_data:
+                        breaker.record_success()
+                        events.append((provider_name, "ok"))
+                        return provider_name, chart_data
+                    
+                    breaker.record_failure()
+                    events.append((provider_name, "empty"))
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        return None, None
+    
     async def get_coin_image_url(self, coin_id: str) -> Optional[str]:
         coin = coin_registry.get_coin(coin_id)
         if not coin:
@@ -222,31 +602,43 @@ class AggregationService:
         if not coingecko_id:
             return None
         
-        return await self.static_providers["coingecko"].get_coin_image_url(coingecko_id)
+        image_url = self._image_url_cache.get(coin_id)
+        if image_url is not None:
+            return image_url
+        
+        image_url = await _STATIC_PROVIDERS["coingecko"].get_coin_image_url(coingecko_id)
+        if image_url:
+            self._image_url_cache.set(coin_id, image_url)
+        return image_url
+    
+    def invalidate_coin(self, coin_id: str):
+        """Drop in-process cached static data and image URL for a coin"""
+        self._static_cache.invalidate(coin_id)
+        self._image_url_cache.invalidate(coin_id)
     
     async def get_coin_details(self, coin_id: str) -> Optional[Dict]:
-        # Get static data and price in parallel
-        static_task = self.get_coin_static_data(coin_id)
-        price_task = self.get_coin_price(coin_id)
+        # Resolve the coin once; the price path works off precomputed plans
+        coin = coin_registry.get_coin(coin_id)
+        if not coin:
+            return None
         
-        static_data, price_data = await asyncio.gather(static_task, price_task)
+        # Get static data and price in parallel
+        static_data, price_data = await asyncio.gather(
+            self._get_static_for_coin(coin),
+            self.get_coin_price(coin_id),
+        )
         
         if not static_data:
             return None
         
-        # Combine data
-        result = static_data.copy()
-        
-        if price_data:
-            result["currentPrice"] = price_data.get("price", 0)
-            result["priceChange24h"] = price_data.get("percent_change_24h", 0)
-            result["volume24h"] = price_data.get("volume_24h", 0)
-        else:
-            result["currentPrice"] = 0
-            result["priceChange24h"] = 0
-            result["volume24h"] = 0
-        
-        return result
+        # Combine data in a single dict build
+        price_data = price_data or {}
+        return {
+            **static_data,
+            "currentPrice": price_data.get("price", 0),
+            "priceChange24h": price_data.get("percent_change_24h", 0),
+            "volume24h": price_data.get("volume_24h", 0),
+        }
 
 # Global instance
 aggregation_service = AggregationService()
\ No newline at end of file
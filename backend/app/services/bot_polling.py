@@ -3,70 +3,182 @@ Simple polling service for getting updates from Telegram Bot API
 Works without webhook - bot itself requests updates
 """
 import asyncio
+import hashlib
 import httpx
 import logging
-from typing import Optional, Dict, Any, List
+import random
+import time
+import msgspec
+import orjson
+from typing import Optional, Dict, Any, List, Set, Tuple
 from app.core.config import settings
 from app.core.database import SessionLocal
-from app.services.user_service import get_or_create_user
+from app.services.user_service import upsert_users_bulk
 from app.services.telegram import telegram_service
 from app.services.coingecko_quick import coingecko_quick
 from app.services.chart_generator import chart_generator
 from app.services.chart_storage import chart_storage
+from app.utils.cache import TTLCache
 from app.utils.formatters import format_price
 
+logger = logging.getLogger(__name__)
+
+
+# Typed getUpdates payload: only the fields handlers use are declared, the rest
+# of each update is skipped while decoding
+class TelegramUser(msgspec.Struct):
+    # Same fields as a users row upserted on /start, see get_user_row
+    id: int
+    username: Optional[str] = None
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    language_code: Optional[str] = None
+
+
+class TelegramChat(msgspec.Struct):
+    id: int
+
+
+class TelegramMessage(msgspec.Struct):
+    chat: TelegramChat
+    from_: Optional[TelegramUser] = msgspec.field(default=None, name="from")
+    text: str = ""
+
+
+class TelegramInlineQuery(msgspec.Struct):
+    id: str
+    from_: TelegramUser = msgspec.field(name="from")
+    query: str = ""
+
+
+class TelegramChosenInlineResult(msgspec.Struct):
+    result_id: str
+
+
+class TelegramUpdate(msgspec.Struct):
+    update_id: int
+    message: Optional[TelegramMessage] = None
+    inline_query: Optional[TelegramInlineQuery] = None
+    chosen_inline_result: Optional[TelegramChosenInlineResult] = None
+
+
+class TelegramUpdateId(msgspec.Struct):
+    update_id: int
+
+
+class GetUpdatesResponse(msgspec.Struct):
+    ok: bool
+    # Updates are decoded one by one, so a single unexpected update can't
+    # fail the whole batch
+    result: List[msgspec.Raw] = []
+    description: Optional[str] = None
+
+
+_get_updates_decoder = msgspec.json.Decoder(GetUpdatesResponse)
+_update_decoder = msgspec.json.Decoder(TelegramUpdate)
+_update_id_decoder = msgspec.json.Decoder(TelegramUpdateId)
+
+
+# Static texts and templates, built once at import
+_WELCOME_MSG = (
+    "👋 Welcome to CryptoWatcher!\n\n"
+    "🔔 Create notifications for cryptocurrency price changes\n"
+    "📊 Track charts and get alerts\n\n"
+    "Open the app to get started!"
+)
+
+# sendMessage body of the welcome message, encoded once; only chat_id is
+# filled in per user, between the prefix and the suffix
+_WELCOME_BODY_PREFIX = b'{"chat_id":'
+_WELCOME_BODY_SUFFIX = (
+    b',"text":' + orjson.dumps(_WELCOME_MSG)
+    + b',"parse_mode":"HTML","disable_web_page_preview":true}'
+)
+
+# Zero-width space link makes Telegram show the chart image as message preview
+_INLINE_CHART_TEMPLATE = (
+    "[\u200B]({image_url})\n\n"
+    "📊 {name} ({symbol}) • {timeframe}\n"
+    "💰 {price}\n"
+    "{emoji} {change}"
+)
+
+# Public URL prefix of stored chart images (first allowed origin)
+_CHART_URL_PREFIX = settings.ALLOWED_ORIGINS.split(",")[0].strip().rstrip('/') + "/api/v1/charts/"
+
 
 class MessageHandler:
     """Handles Telegram message updates"""
     
+    # Welcome messages sent at once - a burst of /start messages in one batch
+    # is sent concurrently, kept under Telegram's ~30 messages/sec bot limit
+    MAX_CONCURRENT_SENDS = 25
+    _send_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+    
+    # Users welcomed recently; repeated /start within this window (double
+    # taps, spam) is neither upserted again nor answered. A user is recorded
+    # only once the welcome message is sent, so a failed send can be retried
+    START_REPEAT_TTL = 30
+    _recent_starts = TTLCache(ttl=START_REPEAT_TTL, maxsize=10_000)  # user ID -> True
+    _starts_in_flight: set = set()  # user IDs with a welcome message being sent
+    
+    @staticmethod
+    def _get_start_sender(message: TelegramMessage) -> Optional[TelegramUser]:
+        """Return sender of a valid /start message, None for any other message"""
+        # Check if there's a sender
+        from_user = message.from_
+        if from_user is None or not from_user.id:
+            return None
+        
+        # Check chat info
+        if not message.chat.id:
+            return None
+        
+        # Check message text (Telegram trims message text, no strip() needed)
+        if not message.text.startswith("/start"):
+            return None
+        
+        return from_user
+    
+    @staticmethod
+    def get_user_row(message: TelegramMessage) -> Optional[Dict[str, Any]]:
+        """
+        User row to upsert for a /start message
+        
+        Users are upserted for the whole update batch at once,
+        before the messages are processed.
+        """
+        from_user = MessageHandler._get_start_sender(message)
+        if from_user is None or MessageHandler._recent_starts.get(from_user.id):
+            return None
+        
+        return msgspec.structs.asdict(from_user)
+    
     @staticmethod
-    async def process(message: Dict[str, Any], db: SessionLocal, logger):
+    async def process(message: TelegramMessage, logger):
         """Process a message update"""
         try:
-            # Check if there's a sender
-            if "from" not in message:
-                return
-            
-            from_user = message["from"]
-            user_id = from_user.get("id")
-            
-            if not user_id:
-                return
-            
-            # Get chat info
-            chat = message.get("chat", {})
-            chat_id = chat.get("id")
-            
-            if not chat_id:
-                return
-            
-            # Get message text
-            text = message.get("text", "").strip()
-                        
-            # Process /start command
-            if text == "/start" or text.startswith("/start"):                
-                # Create or update user
-                user = get_or_create_user(
-                    db=db,
-                    user_id=user_id,
-                    username=from_user.get("username"),
-                    first_name=from_user.get("first_name"),
-                    last_name=from_user.get("last_name"),
-                    language_code=from_user.get("language_code"),
-                )
+            # Process /start command (user is already created, see get_user_row)
+            from_user = MessageHandler._get_start_sender(message)
+            if from_user is not None:
+                user_id = from_user.id
+                if (
+                    MessageHandler._recent_starts.get(user_id)
+                    or user_id in MessageHandler._starts_in_flight
+                ):
+                    return
+                MessageHandler._starts_in_flight.add(user_id)
                 
                 # Send welcome message
-                welcome_message = (
-                    "👋 Welcome to CryptoWatcher!\n\n"
-                    "🔔 Create notifications for cryptocurrency price changes\n"
-                    "📊 Track charts and get alerts\n\n"
-                    "Open the app to get started!"
-                )
-                
-                await telegram_service.send_message(
-                    chat_id=user_id,
-                    text=welcome_message,
-                )
+                try:
+                    async with MessageHandler._send_semaphore:
+                        sent = await telegram_service.send_message_body(
+                            _WELCOME_BODY_PREFIX + str(user_id).encode() + _WELCOME_BODY_SUFFIX
+                        )
+                    if sent:
+                        MessageHandler._recent_starts.set(user_id, True)
+                finally:
+                    MessageHandler._starts_in_flight.discard(user_id)
                 return
         
         except Exception as e:
@@ -76,6 +188,41 @@ class MessageHandler:
 class InlineQueryHandler:
     """Handles Telegram inline query updates"""
     
+    # Telegram sends an inline query per keystroke; a query is answered only
+    # if no newer query from the same user arrives within this delay
+    DEBOUNCE_DELAY = 0.15
+    
+    _user_tasks: Dict[int, asyncio.Task] = {}  # user ID -> latest query task
+    
+    # Inline queries rendering charts at once; queries over the limit get the
+    # text-only card instead of waiting (each query renders up to 3 charts)
+    MAX_CONCURRENT_CHART_JOBS = 16
+    _chart_semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHART_JOBS)
+    
+    # Rendered charts by content key (symbol, timeframe, price, minute), so
+    # the same chart requested again within a minute is neither re-rendered
+    # nor stored under a new URL
+    CHART_REUSE_TTL = 60
+    _chart_ids = TTLCache(ttl=CHART_REUSE_TTL, maxsize=512)  # content key -> chart ID
+    
+    # Chart results of an inline query, in display order: (days, label)
+    CHART_TIMEFRAMES = ((7, "7D"), (1, "1D"), (30, "30D"))
+    
+    # Max wait for the coin icon once chart data is in (seconds); a slow icon
+    # download (up to its 5s timeout) would otherwise hold back every render
+    ICON_WAIT_TIMEOUT = 1.0
+    
+    # Telegram caches answers per query text for cache_time seconds. Answers
+    # without charts or without a coin may be caused by load or a failed
+    # lookup, so they are cached briefly to be retried soon
+    CACHE_TIME = 300
+    FALLBACK_CACHE_TIME = 10
+    
+    @staticmethod
+    def _chart_key(coin_data: Dict[str, Any], days: int) -> str:
+        raw = f"{coin_data['symbol']}|{days}|{coin_data['price']:.4f}|{int(time.time() // 60)}"
+        return hashlib.blake2b(raw.encode(), digest_size=8).hexdigest()
+    
     @staticmethod
     async def _generate_chart_result(
         coin_data: Dict[str, Any],
@@ -83,56 +230,59 @@ class InlineQueryHandler:
         timeframe_label: str,
         chart_data: List[Dict[str, Any]],
         preloaded_icon,
+        price_fields: Dict[str, str],
     ) -> Optional[Dict[str, Any]]:
         """Generate a single chart result for inline query.
 
-        Expects chart_data and preloaded_icon to be provided by the caller
-        so that HTTP fetches happen once, not per-timeframe.
+        Expects chart_data, preloaded_icon and price_fields to be provided by
+        the caller so that HTTP fetches and price formatting happen once,
+        not per-timeframe.
         """
         try:
             if not chart_data:
                 return None
 
-            price_text = format_price(coin_data['price'])
-            change_text = f"{coin_data['percent_change_24h']:+.2f}%"
-            change_emoji = "📈" if coin_data['percent_change_24h'] >= 0 else "📉"
-
-            chart_bytes = await chart_generator.generate_chart(
-                coin_symbol=coin_data["symbol"],
-                coin_name=coin_data["name"],
-                current_price=coin_data["price"],
-                percent_change_24h=coin_data["percent_change_24h"],
-                chart_data=chart_data,
-                days=days,
-                market_cap=coin_data.get("market_cap"),
-                volume_24h=coin_data.get("volume_24h"),
-                high_24h=coin_data.get("high_24h"),
-                low_24h=coin_data.get("low_24h"),
-                preloaded_icon=preloaded_icon,
-            )
-
-            if not chart_bytes:
-                return None
+            # Reuse chart rendered for the same content, if it is still stored
+            chart_key = InlineQueryHandler._chart_key(coin_data, days)
+            chart_id = InlineQueryHandler._chart_ids.get(chart_key)
+            if chart_id is not None and chart_storage.get_chart(chart_id) is None:
+                chart_id = None
+
+            if chart_id is None:
+                chart_bytes = await chart_generator.generate_chart(
+                    coin_symbol=coin_data["symbol"],
+                    coin_name=coin_data["name"],
+                    current_price=coin_data["price"],
+                    percent_change_24h=coin_data["percent_change_24h"],
+                    chart_data=chart_data,
+                    days=days,
+                    market_cap=coin_data.get("market_cap"),
+                    volume_24h=coin_data.get("volume_24h"),
+                    high_24h=coin_data.get("high_24h"),
+                    low_24h=coin_data.get("low_24h"),
+                    preloaded_icon=preloaded_icon,
+                )
 
-            chart_id = chart_storage.store_chart(chart_bytes, coin_data["symbol"])
+                if not chart_bytes:
+                    return None
 
-            allowed_origins = settings.ALLOWED_ORIGINS.split(",")
-            base_url = allowed_origins[0].strip().rstrip('/')
-            image_url = f"{base_url}/api/v1/charts/{chart_id}"
+                chart_id = chart_storage.store_chart(chart_bytes, coin_data["symbol"])
+                InlineQueryHandler._chart_ids.set(chart_key, chart_id)
 
-            zwsp = "\u200B"
-            message_text = (
-                f"[{zwsp}]({image_url})\n\n"
-                f"📊 {coin_data['name']} ({coin_data['symbol']}) • {timeframe_label}\n"
-                f"💰 {price_text}\n"
-                f"{change_emoji} {change_text}"
+            image_url = _CHART_URL_PREFIX + chart_id
+            message_text = _INLINE_CHART_TEMPLATE.format(
+                image_url=image_url,
+                name=coin_data['name'],
+                symbol=coin_data['symbol'],
+                timeframe=timeframe_label,
+                **price_fields,
             )
 
             return {
                 "type": "article",
                 "id": f"coin_{coin_data['symbol']}_{days}d",
                 "title": f"{coin_data['name']} ({coin_data['symbol']}) • {timeframe_label}",
-                "description": f"{price_text} {change_emoji} {change_text}",
+                "description": price_fields["description"],
                 "input_message_content": {
                     "message_text": message_text,
                     "parse_mode": "Markdown",
@@ -140,15 +290,98 @@ class InlineQueryHandler:
                 "thumb_url": image_url,
             }
         except Exception as e:
-            logging.getLogger(__name__).exception("Error generating chart result")
+            logger.exception("Error generating chart result")
             return None
 
+    @classmethod
+    async def process(cls, inline_query: TelegramInlineQuery, logger):
+        """
+        Process an inline query update, latest query per user wins
+        
+        A newer query from the same user cancels the previous one, whether it
+        is still waiting out DEBOUNCE_DELAY or already fetching and rendering.
+        """
+        user_id = inline_query.from_.id
+        if not user_id:
+            await cls._answer(inline_query, logger)
+            return
+        
+        previous = cls._user_tasks.get(user_id)
+        if previous is not None and not previous.done():
+            previous.cancel()
+        
+        task = asyncio.create_task(cls._answer_debounced(inline_query, logger))
+        cls._user_tasks[user_id] = task
+        
+        def _on_done(t: asyncio.Task):
+            if cls._user_tasks.get(user_id) is t:
+                del cls._user_tasks[user_id]
+        
+        task.add_done_callback(_on_done)
+        
+        # Wait without propagating cancellation by a newer query to the caller
+        try:
+            await asyncio.wait({task})
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+    
+    @classmethod
+    async def _answer_debounced(cls, inline_query: TelegramInlineQuery, logger):
+        await asyncio.sleep(cls.DEBOUNCE_DELAY)
+        await cls._answer(inline_query, logger)
+    
     @staticmethod
-    async def process(inline_query: Dict[str, Any], logger):
-        """Process an inline query update"""
+    async def _build_chart_results(coin_data: Dict[str, Any], price_fields: Dict[str, str]) -> List[Dict[str, Any]]:
+        """
+        Fetch chart data and icon, render 7D, 1D and 30D chart results
+        
+        The icon is loaded once and shared. Each timeframe is rendered as soon
+        as its own chart data and the icon are in, without waiting for the
+        other timeframes' fetches. If the icon takes longer than
+        ICON_WAIT_TIMEOUT, charts are rendered without it.
+        """
+        coin_id = coin_data.get("id")
+        coin_icon_url = coin_data.get("large") or coin_data.get("thumb")
+
+        # 2. Start icon load right away, shared by all timeframes
+        icon_task = asyncio.create_task(chart_generator._load_icon(coin_icon_url))
+
+        async def _fetch_and_render(days: int, timeframe_label: str) -> Optional[Dict[str, Any]]:
+            chart_data = await coingecko_quick.get_coin_chart_data(coin_id, days=days)
+            if not chart_data:
+                return None
+            try:
+                preloaded_icon = await asyncio.wait_for(
+                    asyncio.shield(icon_task), InlineQueryHandler.ICON_WAIT_TIMEOUT)
+            except Exception:
+                preloaded_icon = None
+            return await InlineQueryHandler._generate_chart_result(
+                coin_data, days=days, timeframe_label=timeframe_label,
+                chart_data=chart_data, preloaded_icon=preloaded_icon,
+                price_fields=price_fields)
+
+        # 3. Fetch and render all timeframes in parallel, tasks start immediately
+        tasks = [
+            asyncio.create_task(_fetch_and_render(days, label))
+            for days, label in InlineQueryHandler.CHART_TIMEFRAMES
+        ]
         try:
-            query_id = inline_query.get("id")
-            query_text = inline_query.get("query", "").strip().upper()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        except asyncio.CancelledError:
+            icon_task.cancel()
+            raise
+        # A slow icon is left to finish loading in the background, so the
+        # icon cache has it for the next query
+
+        return [r for r in results if r and not isinstance(r, Exception)]
+
+    @staticmethod
+    async def _answer(inline_query: TelegramInlineQuery, logger):
+        """Answer an inline query with charts for the queried coin"""
+        try:
+            query_id = inline_query.id
+            query_text = inline_query.query.strip().upper()
 
             if not query_id:
                 return
@@ -157,66 +390,52 @@ class InlineQueryHandler:
                 await telegram_service.answer_inline_query(query_id, [])
                 return
 
-            if len(query_text) > 10:
-                query_text = query_text[:10]
+            query_text = query_text[:coingecko_quick.SEARCH_QUERY_MAX_LENGTH]
+
+            # Typos and partial input matching no coin symbol, name or id are
+            # answered right away, without the search API call
+            if not coingecko_quick.is_known_coin(query_text):
+                await telegram_service.answer_inline_query(query_id, [])
+                return
 
             # 1. Search coin + price in a single API call
             coin_data = await coingecko_quick.search_coin_with_price(query_text)
 
             if not coin_data:
-                await telegram_service.answer_inline_query(query_id, [])
+                await telegram_service.answer_inline_query(
+                    query_id, [], cache_time=InlineQueryHandler.FALLBACK_CACHE_TIME)
                 return
 
             price_text = format_price(coin_data['price'])
             change_text = f"{coin_data['percent_change_24h']:+.2f}%"
             change_emoji = "📈" if coin_data['percent_change_24h'] >= 0 else "📉"
+            description = f"{price_text} {change_emoji} {change_text}"
+            # Shared by all chart results of the query
+            price_fields = {
+                "price": price_text,
+                "emoji": change_emoji,
+                "change": change_text,
+                "description": description,
+            }
 
-            coin_id = coin_data.get("id")
-            coin_icon_url = coin_data.get("large") or coin_data.get("thumb")
-
-            # 2. Fetch ALL chart data (7d, 1d, 30d) + icon in ONE parallel batch
-            preloaded_icon, chart_data_7d, chart_data_1d, chart_data_30d = await asyncio.gather(
-                chart_generator._load_icon(coin_icon_url, size=256),
-                coingecko_quick.get_coin_chart_data(coin_id, days=7),
-                coingecko_quick.get_coin_chart_data(coin_id, days=1),
-                coingecko_quick.get_coin_chart_data(coin_id, days=30),
-                return_exceptions=True
-            )
-
-            if isinstance(preloaded_icon, Exception):
-                preloaded_icon = None
-            if isinstance(chart_data_7d, Exception):
-                chart_data_7d = None
-            if isinstance(chart_data_1d, Exception):
-                chart_data_1d = None
-            if isinstance(chart_data_30d, Exception):
-                chart_data_30d = None
-
-            # 3. Render all 3 charts in parallel (icon already loaded, no extra HTTP)
-            result_7d, result_1d, result_30d = await asyncio.gather(
-                InlineQueryHandler._generate_chart_result(
-                    coin_data, days=7, timeframe_label="7D",
-                    chart_data=chart_data_7d, preloaded_icon=preloaded_icon),
-                InlineQueryHandler._generate_chart_result(
-                    coin_data, days=1, timeframe_label="1D",
-                    chart_data=chart_data_1d or [], preloaded_icon=preloaded_icon),
-                InlineQueryHandler._generate_chart_result(
-                    coin_data, days=30, timeframe_label="30D",
-                    chart_data=chart_data_30d or [], preloaded_icon=preloaded_icon),
-                return_exceptions=True
-            )
-
+            # 2-3. Charts, unless the chart job limit is reached - then answer
+            # with the text card right away instead of queueing behind renders
             results = []
-            for r in (result_7d, result_1d, result_30d):
-                if r and not isinstance(r, Exception):
-                    results.append(r)
-
+            chart_semaphore = InlineQueryHandler._chart_semaphore
+            if not chart_semaphore.locked():
+                async with chart_semaphore:
+                    results = await InlineQueryHandler._build_chart_results(coin_data, price_fields)
+            else:
+                logger.info(f"Chart job limit reached, answering {coin_data['symbol']} without charts")
+
+            cache_time = InlineQueryHandler.CACHE_TIME
             if not results:
+                cache_time = InlineQueryHandler.FALLBACK_CACHE_TIME
                 result = {
                     "type": "article",
                     "id": f"coin_{coin_data['symbol']}",
                     "title": f"{coin_data['name']} ({coin_data['symbol']})",
-                    "description": f"{price_text} {change_emoji} {change_text}",
+                    "description": description,
                     "input_message_content": {
                         "message_text": f"📊 {coin_data['name']} ({coin_data['symbol']})\n"
                                        f"💰 {price_text}\n"
@@ -226,7 +445,7 @@ class InlineQueryHandler:
                 results = [result]
 
             logger.debug(f"Sending {len(results)} inline query results for {coin_data['symbol']}")
-            success = await telegram_service.answer_inline_query(query_id, results)
+            success = await telegram_service.answer_inline_query(query_id, results, cache_time=cache_time)
             if not success:
                 logger.warning(f"Failed to answer inline query for {coin_data['symbol']}")
 
@@ -238,28 +457,27 @@ class UpdateDispatcher:
     """Dispatches updates to appropriate handlers"""
     
     @staticmethod
-    async def process(update: Dict[str, Any], db: SessionLocal, logger):
+    async def process(update: TelegramUpdate, logger):
         """Process a single update"""
         try:
-            update_id = update.get("update_id")
-            logger.debug(f"Processing update {update_id}, keys: {list(update.keys())}")
+            logger.debug(f"Processing update {update.update_id}")
             
             # Handle inline query
-            if "inline_query" in update:
-                logger.info(f"Received inline query: {update['inline_query'].get('query', '')}")
-                await InlineQueryHandler.process(update["inline_query"], logger)
+            if update.inline_query is not None:
+                logger.info(f"Received inline query: {update.inline_query.query}")
+                await InlineQueryHandler.process(update.inline_query, logger)
                 return
             
             # Handle chosen inline result
-            if "chosen_inline_result" in update:
-                logger.info(f"Received chosen inline result: {update['chosen_inline_result'].get('result_id', '')}")
+            if update.chosen_inline_result is not None:
+                logger.info(f"Received chosen inline result: {update.chosen_inline_result.result_id}")
                 # Chart is already sent via inline message with embedded image
                 # No need to send separate photo
                 return
             
             # Handle message
-            if "message" in update:
-                await MessageHandler.process(update["message"], db, logger)
+            if update.message is not None:
+                await MessageHandler.process(update.message, logger)
                 return
         
         except Exception as e:
@@ -269,25 +487,57 @@ class UpdateDispatcher:
 class BotPolling:
 
     BASE_URL = settings.TELEGRAM_API_URL
+    MAX_CONCURRENT_UPDATES = 64  # Updates processed at once across all batches (chart jobs have their own limit)
+    POLL_TIMEOUT = 50  # Long-poll timeout of getUpdates (seconds, Telegram max is 50)
+    POLL_LIMIT = 100  # Max updates per getUpdates (Telegram max is 100)
+    
+    # Backoff after failed polls (seconds): base * 2^streak with jitter, capped
+    BACKOFF_BASE = 0.5
+    BACKOFF_MAX = 30.0
+    
+    # Update types the bot handles; arrays in query parameters must be JSON-encoded
+    ALLOWED_UPDATES = orjson.dumps(["message", "inline_query", "chosen_inline_result"]).decode()
     
     def __init__(self):
         self.bot_token = settings.TELEGRAM_BOT_TOKEN
         self.offset = 0
         self.running = False
-        self._logger = logging.getLogger(__name__)
+        # Last batch hit POLL_LIMIT - more updates are waiting, poll without long-poll wait
+        self._saturated = False
+        self._error_streak = 0  # Failed polls in a row
+        # getUpdates query, reused across polls - only offset and timeout change
+        self._poll_params: Dict[str, Any] = {
+            "offset": 0,
+            "timeout": self.POLL_TIMEOUT,
+            "limit": self.POLL_LIMIT,
+            "allowed_updates": self.ALLOWED_UPDATES,
+        }
+        self._logger = logger
         
-        # Create single HTTP client (reused across all polls)
-        _proxy = settings.TELEGRAM_PROXY or None
-        self.http_client = httpx.AsyncClient(
-            timeout=30.0,
-            **({'proxies': _proxy} if _proxy else {}),
-        )
+        # Single HTTP client reused across all polls, created in start()
+        # so its connection pool belongs to the polling event loop
+        self.http_client: Optional[httpx.AsyncClient] = None
+        
+        # Update batches are processed in background tasks, so a slow inline
+        # query doesn't hold back the next getUpdates
+        self._update_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_UPDATES)
+        self._batch_tasks: Set[asyncio.Task] = set()
         
         if not self.bot_token:
             self._logger.warning("TELEGRAM_BOT_TOKEN is not set")
     
-    def _get_url(self, method: str) -> str:
-        return f"{self.BASE_URL}{self.bot_token}/{method}"
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create keep-alive HTTP client for Telegram Bot API"""
+        _proxy = settings.TELEGRAM_PROXY or None
+        return httpx.AsyncClient(
+            # Requests pass only the API method, e.g. "/getUpdates"
+            base_url=f"{self.BASE_URL}{self.bot_token}",
+            # Read timeout must exceed the long-poll timeout of getUpdates
+            timeout=httpx.Timeout(self.POLL_TIMEOUT + 5.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60),
+            http2=settings.HTTP2_ENABLED,
+            **({'proxies': _proxy} if _proxy else {}),
+        )
     
     
     async def _poll_updates(self):
@@ -296,67 +546,187 @@ class BotPolling:
             return
         
         try:
-            params = {
-                "offset": self.offset,
-                "timeout": 10,
-                "allowed_updates": ["message", "inline_query", "chosen_inline_result"],
-            }
+            params = self._poll_params
+            params["offset"] = self.offset
+            params["timeout"] = 0 if self._saturated else self.POLL_TIMEOUT
             
             response = await self.http_client.get(
-                self._get_url("getUpdates"),
+                "/getUpdates",
                 params=params,
             )
             
             if response.status_code != 200:
-                await asyncio.sleep(5)
+                retry_after = self._get_retry_after(response)
+                self._logger.warning(
+                    f"getUpdates failed with HTTP {response.status_code}"
+                    + (f", retry after {retry_after}s" if retry_after else "")
+                )
+                await self._backoff(retry_after)
                 return
             
-            result = response.json()
+            result = _get_updates_decoder.decode(response.content)
             
-            if not result.get("ok"):
-                error_description = result.get("description", "Unknown error")
+            if not result.ok:
+                error_description = result.description or "Unknown error"
                 self._logger.error(f"Error from Telegram API: {error_description}")
-                await asyncio.sleep(5)
+                await self._backoff(self._get_retry_after(response))
                 return
             
-            updates = result.get("result", [])
+            self._error_streak = 0
+            self._saturated = len(result.result) >= self.POLL_LIMIT
+            updates, last_update_id = self._decode_updates(result.result)
+            
+            if last_update_id is not None:
+                # Update offset from the whole response before processing,
+                # so the next getUpdates is sent right away. Skipped updates
+                # count too, otherwise they would be fetched again forever
+                self.offset = last_update_id + 1
             
             if updates:
                 self._logger.debug(f"Received {len(updates)} updates")
-                # Create DB session for processing updates
-                db = SessionLocal()
-                try:
-                    for update in updates:
-                        # Update offset before processing
-                        self.offset = update["update_id"] + 1
-                        await UpdateDispatcher.process(update, db, self._logger)
-                finally:
-                    db.close()
+                task = asyncio.create_task(self._process_batch(updates))
+                self._batch_tasks.add(task)
+                task.add_done_callback(self._batch_tasks.discard)
         
         except httpx.TimeoutException:
             pass
+        except httpx.TransportError as e:
+            # Connection resets and the like are usually transient - retry
+            # after a short backoff that grows only if they keep happening
+            self._logger.warning(f"Network error polling updates: {e!r}")
+            await self._backoff()
         except Exception as e:
             self._logger.exception("Error polling updates")
-            await asyncio.sleep(5)
+            await self._backoff()
+    
+    def _decode_updates(self, raw_updates: List[msgspec.Raw]) -> Tuple[List[TelegramUpdate], Optional[int]]:
+        """
+        Decode getUpdates results one by one, skipping malformed updates
+        
+        Returns:
+            Tuple (updates, last_update_id); last_update_id also covers
+            skipped updates, None if no update ID could be read
+        """
+        updates = []
+        last_update_id = None
+        for raw in raw_updates:
+            try:
+                update = _update_decoder.decode(raw)
+            except msgspec.ValidationError as e:
+                try:
+                    last_update_id = _update_id_decoder.decode(raw).update_id
+                except msgspec.ValidationError:
+                    pass
+                self._logger.warning(f"Skipping malformed update {last_update_id}: {e}")
+                continue
+            updates.append(update)
+            last_update_id = update.update_id
+        return updates, last_update_id
+    
+    @staticmethod
+    def _get_retry_after(response: httpx.Response) -> Optional[float]:
+        """Get retry_after (seconds) from Telegram error body or Retry-After header"""
+        try:
+            result = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            result = None
+        if isinstance(result, dict):
+            retry_after = (result.get("parameters") or {}).get("retry_after")
+            if retry_after:
+                return float(retry_after)
+        
+        header = response.headers.get("Retry-After")
+        if header and header.isdigit():
+            return float(header)
+        return None
+    
+    async def _backoff(self, retry_after: Optional[float] = None):
+        """
+        Sleep before the next poll after a failure
+        
+        Telegram's retry_after is obeyed as is; otherwise the delay grows
+        exponentially with the number of failures in a row, with jitter.
+        """
+        if retry_after:
+            delay = retry_after
+        else:
+            delay = min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** self._error_streak)
+            delay *= 0.5 + random.random()
+        self._error_streak += 1
+        await asyncio.sleep(delay)
+    
+    async def _process_batch(self, updates: List[TelegramUpdate]):
+        """
+        Process one getUpdates batch, updates run concurrently
+        
+        Users of all /start messages in the batch are upserted first, in one
+        statement and one transaction, then updates are dispatched in a task
+        group, so cancelling the batch cancels all of its updates.
+        """
+        user_rows = [
+            row for update in updates
+            if update.message is not None
+            and (row := MessageHandler.get_user_row(update.message))
+        ]
+        if user_rows:
+            # Sync DB work runs in the default executor, off the event loop
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._upsert_users, user_rows)
+        
+        async with asyncio.TaskGroup() as tg:
+            for update in updates:
+                tg.create_task(self._process_update(update))
+    
+    def _upsert_users(self, rows: List[Dict[str, Any]]):
+        """Create or update users in one DB session per batch"""
+        db = SessionLocal()
+        try:
+            count = upsert_users_bulk(db, rows)
+            db.commit()
+            self._logger.debug(f"Upserted {count} users from update batch")
+        except Exception:
+            # Welcome messages are still sent, users get created on first app open
+            self._logger.exception("Error upserting users from update batch")
+            db.rollback()
+        finally:
+            db.close()
+    
+    async def _process_update(self, update: TelegramUpdate):
+        # Errors are logged here and never reach the task group,
+        # a failing update must not cancel the rest of its batch
+        try:
+            async with self._update_semaphore:
+                await UpdateDispatcher.process(update, self._logger)
+        except Exception:
+            self._logger.exception(f"Unhandled error processing update {update.update_id}")
     
     async def start(self):
         if not self.bot_token:
             return
         
+        # Reuse client across supervised restarts, recreate only after stop()
+        if self.http_client is None or self.http_client.is_closed:
+            self.http_client = self._create_client()
+        
         self.running = True
         self._logger.info("Telegram bot polling started")
         
         while self.running:
             try:
                 await self._poll_updates()
-            except Exception as e:
-                self._logger.error(f"Critical error: {str(e)}")
-                await asyncio.sleep(5)
+            except Exception:
+                self._logger.exception("Critical error in polling loop")
+                await self._backoff()
     
     async def stop(self):
-        """Stop polling and close HTTP client"""
+        """Stop polling, cancel pending update processing and close HTTP client"""
         self.running = False
-        await self.http_client.aclose()
+        for task in list(self._batch_tasks):
+            task.cancel()
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+        if self.http_client is not None:
+            await self.http_client.aclose()
         self._logger.info("Polling stopped")
 
 # Global instance
@@ -3,6 +3,7 @@ Chart image storage service
 Stores generated chart images temporarily for inline queries
 """
 import logging
+import secrets
 from collections import OrderedDict
 from typing import Optional, Dict
 from datetime import datetime, timezone, timedelta
@@ -13,19 +14,23 @@ logger = logging.getLogger(__name__)
 class ChartStorage:
     """Temporary storage for chart images with size limit and auto-cleanup"""
 
-    def __init__(self, ttl_hours: int = 24, max_items: int = 500):
+    def __init__(self, ttl_hours: int = 24, max_items: int = 500, max_bytes: int = 64 * 1024 * 1024):
         self.storage: OrderedDict[str, Dict] = OrderedDict()
         self.ttl_hours = ttl_hours
         self.max_items = max_items
+        self.max_bytes = max_bytes
+        self._total_bytes = 0
 
     def store_chart(self, image_bytes: bytes, symbol: str) -> str:
-        import secrets
-
         self.cleanup_expired()
 
-        # Evict oldest entries if at capacity
-        while len(self.storage) >= self.max_items:
-            evicted_id, _ = self.storage.popitem(last=False)
+        # Evict oldest entries if at capacity (count or total image size)
+        while self.storage and (
+            len(self.storage) >= self.max_items
+            or self._total_bytes + len(image_bytes) > self.max_bytes
+        ):
+            evicted_id = next(iter(self.storage))
+            self._remove(evicted_id)
             logger.debug(f"Evicted oldest chart {evicted_id} (capacity limit)")
 
         chart_id = secrets.token_urlsafe(16)
@@ -37,6 +42,7 @@ class ChartStorage:
             "created_at": now,
             "expires_at": now + timedelta(hours=self.ttl_hours),
         }
+        self._total_bytes += len(image_bytes)
 
         logger.debug(f"Stored chart for {symbol} with ID {chart_id}")
         return chart_id
@@ -48,7 +54,7 @@ class ChartStorage:
         chart_data = self.storage[chart_id]
 
         if datetime.now(timezone.utc) > chart_data["expires_at"]:
-            del self.storage[chart_id]
+            self._remove(chart_id)
             logger.debug(f"Chart {chart_id} expired, removed")
             return None
 
@@ -56,17 +62,23 @@ class ChartStorage:
 
     def cleanup_expired(self):
         """Remove expired charts"""
+        # All charts share one TTL, so storage is ordered by expiry too:
+        # expired charts are at the front and the scan stops at the first live one
         now = datetime.now(timezone.utc)
-        expired_ids = [
-            chart_id for chart_id, data in self.storage.items()
-            if now > data["expires_at"]
-        ]
+        expired_count = 0
+        while self.storage:
+            chart_id, data = next(iter(self.storage.items()))
+            if now <= data["expires_at"]:
+                break
+            self._remove(chart_id)
+            expired_count += 1
 
-        for chart_id in expired_ids:
-            del self.storage[chart_id]
+        if expired_count:
+            logger.debug(f"Cleaned up {expired_count} expired charts")
 
-        if expired_ids:
-            logger.debug(f"Cleaned up {len(expired_ids)} expired charts")
+    def _remove(self, chart_id: str):
+        chart_data = self.storage.pop(chart_id)
+        self._total_bytes -= len(chart_data["image_bytes"])
 
     def get_stats(self) -> Dict:
         """Get storage statistics"""
@@ -74,6 +86,8 @@ class ChartStorage:
         return {
             "total_charts": len(self.storage),
             "max_items": self.max_items,
+            "total_bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
             "ttl_hours": self.ttl_hours,
         }
 
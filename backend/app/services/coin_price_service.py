@@ -118,11 +118,13 @@ class CoinPriceService:
                     continue
                     
                 if cached_price and cached_price.get("price", 0) > 0:
+                    # Decimals are computed only for entries stored without them
+                    price_decimals = cached_price.get("priceDecimals")
                     prices_dict[coin_id] = {
                         "price": cached_price.get("price", 0),
                         "percent_change_24h": cached_price.get("percent_change_24h", 0),
                         "volume_24h": cached_price.get("volume_24h", 0),
-                        "priceDecimals": cached_price.get("priceDecimals", get_price_decimals(cached_price.get("price", 0))),
+                        "priceDecimals": price_decimals if price_decimals is not None else get_price_decimals(cached_price["price"]),
                     }
         else:
             logger.warning(f"Redis unavailable, prices not available")
@@ -184,10 +186,11 @@ class CoinPriceService:
         result = {}
         for coin_id, price_dict in prices.items():
             if price_dict and price_dict.get("price", 0) > 0:
+                price_decimals = price_dict.get("priceDecimals")
                 result[coin_id] = {
                     "price": price_dict.get("price", 0),
                     "percent_change_24h": price_dict.get("percent_change_24h", 0),
                     "volume_24h": price_dict.get("volume_24h", 0),
-                    "priceDecimals": price_dict.get("priceDecimals", get_price_decimals(price_dict.get("price", 0))),
+                    "priceDecimals": price_decimals if price_decimals is not None else get_price_decimals(price_dict["price"]),
                 }
         return result
\ No newline at end of file
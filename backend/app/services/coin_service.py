@@ -53,9 +53,7 @@ class CoinService:
             self._logger.info(f"Loaded {len(coin_ids)} coins from CoinRegistry (hash: {config_hash[:8]}...)")
             return coin_ids, config_hash
         except Exception as e:
-            self._logger.error(f"Error loading coins from CoinRegistry: {e}")
-            import traceback
-            self._logger.error(f"Traceback: {traceback.format_exc()}")
+            self._logger.exception(f"Error loading coins from CoinRegistry: {e}")
             return [], ""
     
     def _format_coin_data(self, static_data: Dict, price_data: Optional[Dict] = None) -> Dict:
@@ -66,7 +64,9 @@ class CoinService:
             price = price_data.get("price", 0)
             percent_change_24h = price_data.get("percent_change_24h", 0)
             volume_24h = price_data.get("volume_24h", 0)
-            price_decimals = price_data.get("priceDecimals", get_price_decimals(price))
+            price_decimals = price_data.get("priceDecimals")
+            if price_decimals is None:
+                price_decimals = get_price_decimals(price)
         else:
             price = 0
             percent_change_24h = 0
@@ -244,7 +244,9 @@ class CoinService:
         price = price_data.get("price", 0) if price_data else 0
         price_change_24h = price_data.get("volume_24h", 0) if price_data else 0
         price_change_percent_24h = price_data.get("percent_change_24h", 0) if price_data else 0
-        price_decimals = price_data.get("priceDecimals", get_price_decimals(price)) if price_data else get_price_decimals(price)
+        price_decimals = price_data.get("priceDecimals") if price_data else None
+        if price_decimals is None:
+            price_decimals = get_price_decimals(price)
         
         coin = {
             "id": static_data.get("id", coin_id),
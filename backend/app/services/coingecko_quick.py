@@ -4,9 +4,10 @@ Searches coins by symbol and fetches price/chart data
 """
 import asyncio
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Awaitable, Callable, Hashable
 from app.providers.coingecko_client import CoinGeckoClient
 from app.core.coin_registry import coin_registry
+from app.utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +24,98 @@ MARKETS_BASE_PARAMS = {
 class CoinGeckoQuickService:
     """Quick service for searching and fetching coin data from CoinGecko"""
 
+    # Results are cached briefly: inline queries repeat the same tickers
+    # while users type, and popular coins are queried by many users at once
+    CACHE_TTL = 30
+    CACHE_MAXSIZE = 512
+    # Empty results (unknown coin or failed request) are remembered shortly,
+    # so a query retyped within seconds doesn't call the API again
+    CACHE_MISS_TTL = 10
+
+    # Search queries are cut to this many characters
+    SEARCH_QUERY_MAX_LENGTH = 10
+
+    # All CoinGecko symbols, names and ids, refreshed by refresh_known_coins()
+    # this often (seconds), a failed load is retried sooner
+    SYMBOLS_REFRESH_INTERVAL = 3600
+    SYMBOLS_RETRY_INTERVAL = 60
+
     def __init__(self):
         self.client = CoinGeckoClient()
+        self._cache = TTLCache(ttl=self.CACHE_TTL, maxsize=self.CACHE_MAXSIZE)  # key -> Task
+        self._misses = TTLCache(ttl=self.CACHE_MISS_TTL, maxsize=self.CACHE_MAXSIZE)  # key -> True
+        self._known_coins: Optional[frozenset] = None
+
+    async def _cached(self, key: Hashable, fetch: Callable[[], Awaitable]):
+        """
+        Run fetch() once per key and share its result for CACHE_TTL seconds
+
+        The task itself is cached, so concurrent identical lookups share one
+        request. Empty results are kept only for CACHE_MISS_TTL seconds, so
+        failures are retried soon.
+        """
+        if self._misses.get(key):
+            return None
+
+        task = self._cache.get(key)
+        if task is None:
+            task = asyncio.create_task(fetch())
+            self._cache.set(key, task)
+
+            def _on_done(t: asyncio.Task):
+                if t.cancelled() or t.exception() is not None or not t.result():
+                    if self._cache.get(key) is t:
+                        self._cache.invalidate(key)
+                    if not t.cancelled():
+                        self._misses.set(key, True)
+
+            task.add_done_callback(_on_done)
+        return await asyncio.shield(task)
+
+    def is_known_coin(self, query: str) -> bool:
+        """
+        Check whether any coin has this symbol, name or id, without an API call
+
+        Lets inline queries skip the search for typos and partial input.
+        query is expected to be cut to SEARCH_QUERY_MAX_LENGTH already.
+        Returns True while the coin list is not loaded yet, so nothing
+        is filtered until it is.
+        """
+        if self._known_coins is None:
+            return True
+        query_upper = query.upper()
+        return (
+            query_upper in self._known_coins
+            or coin_registry.find_coin_by_symbol(query_upper, enabled_only=True) is not None
+        )
+
+    async def refresh_known_coins(self):
+        """Keep the list behind is_known_coin() loaded (runs as a background task)"""
+        while True:
+            if await self._load_known_coins():
+                await asyncio.sleep(self.SYMBOLS_REFRESH_INTERVAL)
+            else:
+                await asyncio.sleep(self.SYMBOLS_RETRY_INTERVAL)
+
+    async def _load_known_coins(self) -> bool:
+        try:
+            response = await self.client.get("/coins/list")
+            if not response:
+                return False
+            # Searches match names and ids too, keep them as they would be
+            # queried: upper case and cut to the query length
+            max_len = self.SEARCH_QUERY_MAX_LENGTH
+            self._known_coins = frozenset(
+                value.upper()[:max_len]
+                for coin in response
+                for value in (coin.get("symbol"), coin.get("name"), coin.get("id"))
+                if value
+            )
+            logger.info(f"Loaded {len(response)} CoinGecko coins for query filtering")
+            return True
+        except Exception:
+            logger.exception("Failed to load CoinGecko coin list")
+            return False
 
     async def search_coin_with_price(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
@@ -33,9 +124,15 @@ class CoinGeckoQuickService:
         For coins in coin_registry this is ONE /coins/markets request instead of two.
         Returns dict with id, name, symbol, thumb, large, price, percent_change_24h,
         market_cap, volume_24h, high_24h, low_24h — or None.
+        The result is shared between callers and must not be modified.
         """
         symbol_upper = symbol.upper()
+        return await self._cached(
+            ("search", symbol_upper),
+            lambda: self._search_coin_with_price(symbol_upper),
+        )
 
+    async def _search_coin_with_price(self, symbol_upper: str) -> Optional[Dict[str, Any]]:
         # 1. Check registry first
         coin_config = coin_registry.find_coin_by_symbol(symbol_upper, enabled_only=True)
         if coin_config:
@@ -106,7 +203,7 @@ class CoinGeckoQuickService:
                 **price_data,
             }
         except Exception:
-            logger.exception(f"Error searching coin {symbol}")
+            logger.exception(f"Error searching coin {symbol_upper}")
             return None
 
     async def _fetch_price(self, coin_id: str) -> Optional[Dict[str, Any]]:
@@ -160,7 +257,13 @@ class CoinGeckoQuickService:
             return None
 
     async def get_coin_chart_data(self, coin_id: str, days: int = 7) -> Optional[List[Dict[str, Any]]]:
-        """Get chart data for a coin."""
+        """Get chart data for a coin. The result is shared and must not be modified."""
+        return await self._cached(
+            ("chart", coin_id, days),
+            lambda: self._get_coin_chart_data(coin_id, days),
+        )
+
+    async def _get_coin_chart_data(self, coin_id: str, days: int) -> Optional[List[Dict[str, Any]]]:
         try:
             response = await self.client.get(
                 f"/coins/{coin_id}/market_chart",
@@ -197,11 +300,9 @@ class CoinGeckoQuickService:
 
         # Chart data
         chart_data = await self.get_coin_chart_data(coin_data["id"], days)
-        if isinstance(chart_data, Exception):
-            chart_data = None
 
-        coin_data["chart_data"] = chart_data or []
-        return coin_data
+        # Copy: coin_data is the cached search result
+        return {**coin_data, "chart_data": chart_data or []}
 
 
 # Global instance
@@ -1,14 +1,18 @@
 """
 Service for sending notifications to Telegram via Bot API
 """
-import asyncio
 import httpx
 import logging
+import orjson
 from typing import Optional
 from app.core.config import settings
+from app.utils.formatters import format_price
 
 logger = logging.getLogger(__name__)
 
+# JSON bodies are encoded with orjson and sent as raw content
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 class TelegramService:
 
     BASE_URL = settings.TELEGRAM_API_URL
@@ -16,8 +20,14 @@ class TelegramService:
     def __init__(self):
         self.bot_token = settings.TELEGRAM_BOT_TOKEN
         _proxy = settings.TELEGRAM_PROXY or None
+        # Requests pass only the API method, e.g. "/sendMessage".
+        # Sends, photo uploads and inline answers all go to one host, so with
+        # HTTP/2 they share a single kept-alive connection
         self._client = httpx.AsyncClient(
+            base_url=f"{self.BASE_URL}{self.bot_token}",
             timeout=30.0,
+            http2=settings.HTTP2_ENABLED,
+            limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60),
             **({'proxies': _proxy} if _proxy else {}),
         )
         if not self.bot_token:
@@ -26,9 +36,6 @@ class TelegramService:
     async def close(self):
         await self._client.aclose()
 
-    def _get_url(self, method: str) -> str:
-        return f"{self.BASE_URL}{self.bot_token}/{method}"
-
     def _handle_http_error(self, e: httpx.HTTPStatusError, context: str) -> bool:
         status_code = e.response.status_code
         error_message = f"HTTP error {status_code}"
@@ -58,21 +65,26 @@ class TelegramService:
         disable_web_page_preview: bool = True,
     ) -> bool:
 
+        return await self.send_message_body(orjson.dumps({
+            "chat_id": chat_id,
+            "text": text,
+            "parse_mode": parse_mode,
+            "disable_web_page_preview": disable_web_page_preview,
+        }))
+
+    async def send_message_body(self, body: bytes) -> bool:
+        """Send a message from an already JSON-encoded sendMessage body"""
         if not self.bot_token:
             return False
 
         try:
             response = await self._client.post(
-                self._get_url("sendMessage"),
-                json={
-                    "chat_id": chat_id,
-                    "text": text,
-                    "parse_mode": parse_mode,
-                    "disable_web_page_preview": disable_web_page_preview,
-                },
+                "/sendMessage",
+                content=body,
+                headers=_JSON_HEADERS,
             )
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
 
             if result.get("ok"):
                 return True
@@ -96,12 +108,6 @@ class TelegramService:
         value: float,
         value_type: str,
     ) -> bool:
-        from app.utils.formatters import format_price
-        from app.services.chart_generator import chart_generator
-        from app.services.chart_storage import chart_storage
-        from app.services.coingecko_quick import coingecko_quick
-        from app.core.config import settings
-        
         # Determine direction for text with emoji
         direction_info = {
             "rise": ("increased", "↑"),
@@ -144,6 +150,11 @@ class TelegramService:
         )
         
         # Try to generate and send chart image
+        # Imported here: importing the Telegram client must not build the
+        # chart generator or CoinGecko client singletons
+        from app.services.chart_generator import chart_generator
+        from app.services.coingecko_quick import coingecko_quick
+
         try:
             logger.info(f"Generating chart for notification: {crypto_symbol} ({crypto_name})")
             
@@ -240,12 +251,12 @@ class TelegramService:
                 data["parse_mode"] = parse_mode
 
             response = await self._client.post(
-                self._get_url("sendPhoto"),
+                "/sendPhoto",
                 files=files,
                 data=data,
             )
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
 
             if result.get("ok"):
                 return True
@@ -279,15 +290,16 @@ class TelegramService:
         
         try:
             response = await self._client.post(
-                self._get_url("answerInlineQuery"),
-                json={
+                "/answerInlineQuery",
+                content=orjson.dumps({
                     "inline_query_id": inline_query_id,
                     "results": results,
                     "cache_time": cache_time,
-                },
+                }),
+                headers=_JSON_HEADERS,
             )
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
 
             if result.get("ok"):
                 return True
@@ -1,9 +1,16 @@
 """
 Service for working with users
 """
+from typing import Dict, List, Optional
+
+from sqlalchemy import func, or_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from app.models.user import User
 
+# Profile fields taken from Telegram and kept up to date on every /start
+_PROFILE_FIELDS = ("username", "first_name", "last_name", "language_code")
+
 
 def get_or_create_user(
     db: Session,
@@ -12,7 +19,14 @@ def get_or_create_user(
     first_name: str = None,
     last_name: str = None,
     language_code: str = None,
+    commit: bool = True,
 ) -> User:
+    """
+    Get user by ID, creating it or updating changed profile fields
+    
+    With commit=False changes are only flushed, so the caller can run this
+    inside its own transaction or savepoint and commit once for many users.
+    """
     user = db.query(User).filter(User.id == user_id).first()
     
     if not user:
@@ -26,8 +40,11 @@ def get_or_create_user(
             is_active=True,
         )
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        if commit:
+            db.commit()
+            db.refresh(user)
+        else:
+            db.flush()
     else:
         # Update existing user data if it has changed
         updated = False
@@ -45,7 +62,51 @@ def get_or_create_user(
             updated = True
         
         if updated:
-            db.commit()
-            db.refresh(user)
+            if commit:
+                db.commit()
+                db.refresh(user)
+            else:
+                db.flush()
+    
+    return user
+
+
+def upsert_users_bulk(db: Session, rows: List[Dict[str, Optional[str]]]) -> int:
+    """
+    Create or update many users in a single INSERT ... ON CONFLICT statement
+    
+    Same semantics as get_or_create_user: new users are created active,
+    existing users only get profile fields that are set in the row.
+    Changes are flushed, not committed.
+    
+    Args:
+        db: Database session
+        rows: Dicts with "id" and profile fields; later rows for the same
+            user win
+        
+    Returns:
+        Number of distinct users upserted
+    """
+    if not rows:
+        return 0
+    
+    # Postgres rejects a statement that touches the same row twice
+    values = list({row["id"]: {**row, "is_active": True} for row in rows}.values())
     
-    return user
\ No newline at end of file
+    stmt = insert(User).values(values)
+    new_values = {
+        field: func.coalesce(stmt.excluded[field], getattr(User, field))
+        for field in _PROFILE_FIELDS
+    }
+    # Column.onupdate isn't applied to ON CONFLICT updates, so set it here;
+    # rows without actual changes are left untouched
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[User.id],
+        set_={**new_values, "updated_at": func.now()},
+        where=or_(*(
+            value.is_distinct_from(getattr(User, field))
+            for field, value in new_values.items()
+        )),
+    )
+    db.execute(stmt)
+    return len(values)
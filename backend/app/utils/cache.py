@@ -1,15 +1,58 @@
 """
 Cache utilities
 """
-import json
 import logging
-from typing import Dict, List, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+
+import orjson
 
 from app.core.config import settings
 from app.core.redis_client import get_redis
 
 logger = logging.getLogger(__name__)
 
+
+class TTLCache:
+    """
+    In-process LRU cache with per-entry TTL
+    
+    Used in front of Redis for data that changes rarely (static coin data,
+    image URLs), so hot coins don't pay a round-trip and JSON parsing per call.
+    """
+    
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (expires_at, value)
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+        
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any):
+        self._data[key] = (time.monotonic() + self._ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+    
+    def invalidate(self, key: Hashable):
+        self._data.pop(key, None)
+    
+    def clear(self):
+        self._data.clear()
+
+
 class CoinCacheManager:
 
     # TTL for different data types (from config)
@@ -41,7 +84,7 @@ class CoinCacheManager:
         
         try:
             data = await redis.get(self._get_static_key(coin_id))
-            return json.loads(data) if data else None
+            return orjson.loads(data) if data else None
         except Exception as e:
             logger.error(f"Static reading error for {coin_id}: {e}")
             return None
@@ -55,7 +98,7 @@ class CoinCacheManager:
             await redis.setex(
                 self._get_static_key(coin_id),
                 self.CACHE_TTL_COIN_STATIC,
-                json.dumps(static_data)
+                orjson.dumps(static_data)
             )
             return True
         except Exception as e:
@@ -69,7 +112,7 @@ class CoinCacheManager:
         
         try:
             data = await redis.get(self._get_price_key(coin_id))
-            return json.loads(data) if data else None
+            return orjson.loads(data) if data else None
         except Exception as e:
             logger.error(f"Error reading the price for {coin_id}: {e}")
             return None
@@ -83,7 +126,7 @@ class CoinCacheManager:
             await redis.setex(
                 self._get_price_key(coin_id),
                 self.CACHE_TTL_COIN_PRICE,
-                json.dumps(price_data)
+                orjson.dumps(price_data)
             )
             return True
         except Exception as e:
@@ -96,13 +139,26 @@ class CoinCacheManager:
             return None
         
         try:
+            # An empty list is a cached "no data" result, see set_chart
             data = await redis.get(self._get_chart_key(coin_id, period))
-            return json.loads(data) if data else None
+            return orjson.loads(data) if data else None
         except Exception as e:
             logger.error(f"Chart reading error for {coin_id}: {e}")
             return None
     
-    async def set_chart(self, coin_id: str, period: str, chart_data: List[Dict]) -> bool:
+    async def set_chart(
+        self,
+        coin_id: str,
+        period: str,
+        chart_data: List[Dict],
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Save chart to cache
+        
+        An empty chart_data is stored as a negative entry ("no data"),
+        usually with a shorter ttl than CACHE_TTL_CHART.
+        """
         redis = await get_redis()
         if not redis:
             return False
@@ -110,8 +166,8 @@ class CoinCacheManager:
         try:
             await redis.setex(
                 self._get_chart_key(coin_id, period),
-                self.CACHE_TTL_CHART,
-                json.dumps(chart_data)
+                ttl or self.CACHE_TTL_CHART,
+                orjson.dumps(chart_data)
             )
             return True
         except Exception as e:
@@ -188,23 +244,21 @@ class CoinCacheManager:
                 static_data = results[static_idx]
                 price_data = results[price_idx]
                 
-                # Deserialize JSON
+                # Deserialize JSON (invalid UTF-8 is reported as JSONDecodeError)
                 static_dict = None
                 if static_data:
                     try:
-                        if isinstance(static_data, bytes):
-                            static_data = static_data.decode('utf-8')
-                        static_dict = json.loads(static_data) if static_data else None
-                    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                        # orjson takes str and bytes alike
+                        static_dict = orjson.loads(static_data)
+                    except orjson.JSONDecodeError as e:
                         logger.error(f"Static deserialization error for {coin_id}: {e}")
                 
                 price_dict = None
                 if price_data:
                     try:
-                        if isinstance(price_data, bytes):
-                            price_data = price_data.decode('utf-8')
-                        price_dict = json.loads(price_data) if price_data else None
-                    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                        # orjson takes str and bytes alike
+                        price_dict = orjson.loads(price_data)
+                    except orjson.JSONDecodeError as e:
                         logger.error(f"Price deserialization error for {coin_id}: {e}")
                 
                 result[coin_id] = {
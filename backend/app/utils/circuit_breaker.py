@@ -0,0 +1,125 @@
+"""
+Circuit breaker for provider calls
+
+Tracks failures per provider and short-circuits calls to a provider that
+keeps failing, so fallback moves to the next provider without paying
+request/timeout cost first.
+
+States:
+- CLOSED - calls pass through, failures are counted
+- OPEN - calls are rejected until sleep_window has passed
+- HALF_OPEN - one probe call is let through; its result closes or reopens the breaker
+"""
+import logging
+import time
+from enum import Enum
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Hystrix-style circuit breaker for a single provider"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        sleep_window: float = 10.0,
+        error_percentage: int = 50,
+    ):
+        """
+        Args:
+            name: Breaker name for logging (usually provider name)
+            failure_threshold: Minimum failures in the current window to trip
+            sleep_window: Seconds to stay OPEN before letting a probe through;
+                also the length of the failure counting window
+            error_percentage: Minimum share of failed calls (%) to trip
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.sleep_window = sleep_window
+        self.error_percentage = error_percentage
+
+        self.state = CircuitState.CLOSED
+        self.failure_count = 0
+        self.request_count = 0
+        self.last_failure_ts = 0.0
+        self._window_start = time.monotonic()
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+
+    def allow(self) -> bool:
+        """Check if a call may be made now"""
+        if self.state == CircuitState.CLOSED:
+            return True
+
+        now = time.monotonic()
+        if self.state == CircuitState.OPEN:
+            if now - self.last_failure_ts < self.sleep_window:
+                return False
+            self.state = CircuitState.HALF_OPEN
+            self._probe_in_flight = False
+
+        # HALF_OPEN: only one probe at a time (a probe that never reported back,
+        # e.g. a cancelled call, is replaced after sleep_window)
+        if self._probe_in_flight and now - self._probe_started < self.sleep_window:
+            return False
+        self._probe_in_flight = True
+        self._probe_started = now
+        return True
+
+    def record_success(self):
+        """Record successful call"""
+        if self.state != CircuitState.CLOSED:
+            logger.info(f"Circuit breaker {self.name} closed after successful probe")
+            self._reset()
+            return
+
+        self._roll_window()
+        self.request_count += 1
+
+    def record_failure(self):
+        """Record failed call, tripping the breaker if thresholds are exceeded"""
+        now = time.monotonic()
+        self.last_failure_ts = now
+
+        if self.state != CircuitState.CLOSED:
+            # Probe failed - stay open for another sleep window
+            self.state = CircuitState.OPEN
+            self._probe_in_flight = False
+            return
+
+        self._roll_window()
+        self.request_count += 1
+        self.failure_count += 1
+
+        if (
+            self.failure_count >= self.failure_threshold
+            and self.failure_count * 100 >= self.error_percentage * self.request_count
+        ):
+            self.state = CircuitState.OPEN
+            logger.warning(
+                f"Circuit breaker {self.name} opened: "
+                f"{self.failure_count}/{self.request_count} calls failed"
+            )
+
+    def _roll_window(self):
+        """Start a new counting window once the current one has expired"""
+        now = time.monotonic()
+        if now - self._window_start >= self.sleep_window:
+            self._window_start = now
+            self.failure_count = 0
+            self.request_count = 0
+
+    def _reset(self):
+        self.state = CircuitState.CLOSED
+        self.failure_count = 0
+        self.request_count = 0
+        self._window_start = time.monotonic()
+        self._probe_in_flight = False
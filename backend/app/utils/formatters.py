@@ -1,9 +1,11 @@
 """
 Utilities for formatting data
 """
-from typing import Optional, Union
+from typing import List, Optional, Tuple, Union
 from datetime import datetime, timezone
 
+import numpy as np
+
 
 def utc_now() -> datetime:
     """Return current UTC time as timezone-aware datetime."""
@@ -23,10 +25,20 @@ def format_price(price: Optional[float], use_separator: bool = True) -> str:
     """
     if price is None:
         return "N/A"
-    decimals = get_price_decimals(price)
-    if use_separator and price >= 1000:
-        return f"${price:,.{decimals}f}"
-    return f"${price:.{decimals}f}"
+    for threshold, spec_with_separator, spec in _PRICE_FORMAT_SPECS:
+        if price >= threshold:
+            return "$" + format(price, spec_with_separator if use_separator else spec)
+    return "$" + format(price, ".8f")
+
+
+# Pre-built format specs for format_price: (min price, spec with separator, spec).
+# Same decimals as get_price_decimals; the separator only matters from 1000 up
+_PRICE_FORMAT_SPECS = (
+    (1000, ",.2f", ".2f"),
+    (1, ".2f", ".2f"),
+    (0.01, ".4f", ".4f"),
+    (0.0001, ".6f", ".6f"),
+)
 
 
 def get_price_decimals(price: Union[float, int]) -> int:
@@ -49,6 +61,29 @@ def get_price_decimals(price: Union[float, int]) -> int:
         return 8
 
 
+def get_price_decimals_range(price: Union[float, int]) -> Tuple[float, float, int]:
+    """
+    Determine the decimal places for the price together with its price range
+    
+    A coin's price rarely leaves its range, so callers can cache the result
+    per coin and only call this again when the price crosses a boundary.
+    
+    Args:
+        price: The price of the coin
+        
+    Returns:
+        Tuple (low, high, decimals) - decimals apply while low <= price < high
+    """
+    if price >= 1:
+        return 1, float("inf"), 2
+    elif price >= 0.01:
+        return 0.01, 1, 4
+    elif price >= 0.0001:
+        return 0.0001, 0.01, 6
+    else:
+        return float("-inf"), 0.0001, 8
+
+
 def format_chart_date(date_obj: datetime, period: str) -> str:
     """
     Format the date for the chart.
@@ -73,4 +108,16 @@ def format_chart_date(date_obj: datetime, period: str) -> str:
         date_only = date_obj_utc.date()
         # Create datetime with 00:00:00 time in UTC
         date_with_time = datetime.combine(date_only, datetime.min.time(), tzinfo=timezone.utc)
-        return date_with_time.isoformat()
\ No newline at end of file
+        return date_with_time.isoformat()
+
+
+def format_chart_dates(timestamps_ms: np.ndarray) -> List[str]:
+    """
+    Format millisecond timestamps for the chart in one vectorized pass.
+    Returns ISO strings (seconds resolution) with the UTC time zone.
+    Example: ["2025-12-17T18:12:12+00:00", ...]
+    """
+    dates = np.datetime_as_string(
+        np.asarray(timestamps_ms, dtype=np.int64).astype("datetime64[ms]"), unit="s"
+    )
+    return np.char.add(dates, "+00:00").tolist()
@@ -2,6 +2,8 @@
 General HTTP client for reuse in providers
 
 Provides a configured httpx.AsyncClient with common parameters.
+The client is created once and shared, so connections (and HTTP/2
+streams) are reused across providers and requests.
 """
 import httpx
 from typing import Optional
@@ -16,7 +18,8 @@ class SharedHTTPClient:
     def get_client(cls) -> httpx.AsyncClient:
         if cls._client is None:
             cls._client = httpx.AsyncClient(
-                timeout=30.0,
+                http2=settings.HTTP2_ENABLED,
+                timeout=httpx.Timeout(30.0),
                 verify=True,
                 follow_redirects=True,
                 limits=httpx.Limits(
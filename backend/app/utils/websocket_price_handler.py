@@ -2,119 +2,95 @@
 Utility for processing price updates from WebSocket messages
 
 """
-import json
 import asyncio
 import logging
-from typing import Dict, Optional, Callable, Tuple
-from app.core.redis_client import get_redis
-from app.core.coin_registry import coin_registry
-from app.utils.formatters import get_price_decimals
-
-from app.core.config import settings
+from typing import Dict, Optional, Callable, Set, Tuple
+from app.core.coin_registry import CoinConfig
+from app.utils.formatters import get_price_decimals_range
 
 logger = logging.getLogger(__name__)
 
-async def process_price_update(
+def build_price_update(
     ticker: Dict,
-    source: str,
+    symbol_to_coin: Dict[str, CoinConfig],
+    priority_coins: Set[str],
     symbol_extractor: Callable[[Dict], Optional[str]],
-    price_extractor: Callable[[Dict], float],
-    price_change_extractor: Callable[[Dict], float],
-    volume_extractor: Callable[[Dict], float],
-    adapter_name: str,
+    values_extractor: Callable[[Dict], Tuple[float, float, float]],
     tracked_coins: set,
-    last_update_time: Dict[str, float],
-    coins_with_updates: set,
-    redis,
-) -> Tuple[str, Optional[str]]:
+    decimals_cache: Dict[str, Tuple[float, float, int]],
+) -> Tuple[str, Optional[str], Optional[Dict]]:
     """
-    Process price update from WebSocket ticker
+    Build price cache payload from WebSocket ticker
     
     Args:
         ticker: Dictionary with ticker data from exchange
-        source: 
+        symbol_to_coin: Mapping of source symbol to coin config
+        priority_coins: Internal IDs of coins whose first price priority is this source
         symbol_extractor: Function to extract symbol from ticker
-        price_extractor: Function to extract price from ticker
-        price_change_extractor: Function to extract price change from ticker
-        volume_extractor: Function to extract volume from ticker
-        adapter_name: Adapter name for logging
+        values_extractor: Function to extract (price, price change, volume) from ticker
         tracked_coins: Set of tracked coins
-        last_update_time: Dictionary for tracking update times
-        coins_with_updates: Set of coins with updates
-        redis: Redis client
+        decimals_cache: Per-coin (low, high, decimals) ranges, updated in place
         
     Returns:
-        Tuple (status: str, coin_id: Optional[str])
-        status - "updated", "skipped_not_in_map", "skipped_not_tracked", 
-                 "skipped_wrong_priority", "skipped_zero_price", "error"
+        Tuple (status: str, coin_id: Optional[str], price_data: Optional[Dict])
+        status - "ready", "skipped_no_symbol", "skipped_not_in_map", "skipped_not_tracked",
+                 "skipped_wrong_priority", "skipped_zero_price"
         coin_id - internal coin ID or None
+        price_data - payload to write to coin_price:{coin_id} when status is "ready"
     """
     symbol = symbol_extractor(ticker)
     if not symbol:
-        return "skipped_no_symbol", None
+        return "skipped_no_symbol", None, None
     
-    coin = coin_registry.find_coin_by_external_id(source, symbol)
+    coin = symbol_to_coin.get(symbol)
     if not coin:
-        return "skipped_not_in_map", None
+        return "skipped_not_in_map", None, None
     
     coin_id = coin.id
     
     if coin_id not in tracked_coins:
-        return "skipped_not_tracked", coin_id
+        return "skipped_not_tracked", coin_id, None
     
-    price_priority = coin.price_priority
-    if not price_priority or price_priority[0] != source:
-        return "skipped_wrong_priority", coin_id
+    if coin_id not in priority_coins:
+        return "skipped_wrong_priority", coin_id, None
     
-    price = price_extractor(ticker)
+    price, price_change, volume = values_extractor(ticker)
     if price <= 0:
-        return "skipped_zero_price", coin_id
+        return "skipped_zero_price", coin_id, None
     
-    price_change_24h = price_change_extractor(ticker)
-    volume_24h = volume_extractor(ticker)
+    decimals_range = decimals_cache.get(coin_id)
+    if decimals_range is None or not (decimals_range[0] <= price < decimals_range[1]):
+        decimals_range = decimals_cache[coin_id] = get_price_decimals_range(price)
     
     price_data = {
         "price": price,
-        "percent_change_24h": price_change_24h,
-        "volume_24h": volume_24h,
-        "priceDecimals": get_price_decimals(price),
+        "percent_change_24h": price_change,
+        "volume_24h": volume,
+        "priceDecimals": decimals_range[2],
     }
     
-    if not redis:
-        return "error", coin_id
+    return "ready", coin_id, price_data
+
+
+def trigger_notification_check(coin_id: str):
+    """
+    Schedule notification check for a coin after its price was written
     
+    Skips scheduling if a check for this coin is already running.
+    """
     try:
-        price_cache_key = f"coin_price:{coin_id}"
-        await redis.setex(
-            price_cache_key,
-            settings.CACHE_TTL_PRICE,
-            json.dumps(price_data)
-        )
-        
-        current_time = asyncio.get_event_loop().time()
-        last_update_time[coin_id] = current_time
-        coins_with_updates.add(coin_id)
-        
-        try:
-            from app.services.notification_checker import notification_checker
-            # Skip if a check for this coin is already running
-            existing_task = notification_checker._active_tasks.get(coin_id)
-            if existing_task is None or existing_task.done():
-                task = asyncio.create_task(
-                    notification_checker.check_notifications_for_coin(coin_id)
-                )
-                notification_checker._active_tasks[coin_id] = task
+        from app.services.notification_checker import notification_checker
+        existing_task = notification_checker._active_tasks.get(coin_id)
+        if existing_task is None or existing_task.done():
+            task = asyncio.create_task(
+                notification_checker.check_notifications_for_coin(coin_id)
+            )
+            notification_checker._active_tasks[coin_id] = task
 
-                def _on_done(t, cid=coin_id):
-                    if not t.cancelled() and t.exception() is not None:
-                        logger.error(f"Notification check failed for {cid}: {t.exception()}")
+            def _on_done(t, cid=coin_id):
+                if not t.cancelled() and t.exception() is not None:
+                    logger.error(f"Notification check failed for {cid}: {t.exception()}")
 
-                task.add_done_callback(_on_done)
-        except Exception as e:
-            logger.error(f"Failed to trigger notification check for {coin_id}: {e}")
-        
-        return "updated", coin_id
-        
+            task.add_done_callback(_on_done)
     except Exception as e:
-        logger.error(f"Redis write error for {coin_id}: {e}")
-        return "error", coin_id
\ No newline at end of file
+        logger.error(f"Failed to trigger notification check for {coin_id}: {e}")
@@ -0,0 +1,13 @@
+"""Controllable monotonic clock for time-based tests"""
+
+
+class FakeClock:
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
@@ -0,0 +1,63 @@
+import pytest
+
+from app.utils import cache
+from app.utils.cache import TTLCache
+from tests.clock import FakeClock
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache, "time", clock)
+    return clock
+
+
+def test_returns_value_until_ttl_expires(clock):
+    ttl_cache = TTLCache(ttl=5)
+    ttl_cache.set("a", 1)
+
+    clock.advance(4.9)
+    assert ttl_cache.get("a") == 1
+
+    clock.advance(0.1)
+    assert ttl_cache.get("a") is None
+
+
+def test_missing_key_returns_none(clock):
+    assert TTLCache(ttl=5).get("missing") is None
+
+
+def test_set_again_restarts_ttl(clock):
+    ttl_cache = TTLCache(ttl=5)
+    ttl_cache.set("a", 1)
+    clock.advance(4)
+    ttl_cache.set("a", 2)
+    clock.advance(4)
+
+    assert ttl_cache.get("a") == 2
+
+
+def test_evicts_least_recently_used_over_maxsize(clock):
+    ttl_cache = TTLCache(ttl=5, maxsize=2)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    ttl_cache.get("a")  # "b" is now least recently used
+    ttl_cache.set("c", 3)
+
+    assert ttl_cache.get("a") == 1
+    assert ttl_cache.get("b") is None
+    assert ttl_cache.get("c") == 3
+
+
+def test_invalidate_and_clear(clock):
+    ttl_cache = TTLCache(ttl=5)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+
+    ttl_cache.invalidate("a")
+    ttl_cache.invalidate("missing")
+    assert ttl_cache.get("a") is None
+    assert ttl_cache.get("b") == 2
+
+    ttl_cache.clear()
+    assert ttl_cache.get("b") is None
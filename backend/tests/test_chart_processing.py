@@ -0,0 +1,75 @@
+import numpy as np
+
+from app.providers.base_chart import BaseChartAdapter
+from app.utils.formatters import format_chart_dates
+
+
+class _Adapter(BaseChartAdapter):
+    EXCHANGE_NAME = "test"
+
+    async def _fetch_candles(self, coin_id, interval, limit):
+        return []
+
+    def _get_api_symbol(self, coin_id):
+        return coin_id
+
+
+# 2023-11-14T22:13:20Z and one hour later
+TS = 1_700_000_000_000
+HOUR = 3_600_000
+
+
+def test_format_chart_dates():
+    assert format_chart_dates(np.array([TS, TS + HOUR + 999])) == [
+        "2023-11-14T22:13:20+00:00",
+        "2023-11-14T23:13:20+00:00",
+    ]
+
+
+def test_format_chart_dates_accepts_lists():
+    assert format_chart_dates([0]) == ["1970-01-01T00:00:00+00:00"]
+
+
+def test_process_candles_oldest_first():
+    candles = [
+        [TS, "1", "2", "0.5", "1.5", "10"],
+        [TS + HOUR, "1.5", "3", "1", "2.5", "20"],
+    ]
+
+    assert _Adapter()._process_candles(candles, "7d") == [
+        {"date": "2023-11-14T22:13:20+00:00", "price": 1.5, "volume": 10.0},
+        {"date": "2023-11-14T23:13:20+00:00", "price": 2.5, "volume": 20.0},
+    ]
+
+
+def test_process_candles_newest_first_is_reversed():
+    # OKX: newest candle first, timestamps as strings
+    candles = [
+        [str(TS + HOUR), "1.5", "3", "1", "2.5", "20"],
+        [str(TS), "1", "2", "0.5", "1.5", "10"],
+    ]
+
+    result = _Adapter()._process_candles(candles, "7d")
+
+    assert [point["price"] for point in result] == [1.5, 2.5]
+    assert result[0]["date"] == "2023-11-14T22:13:20+00:00"
+
+
+def test_process_candles_ragged_rows():
+    candles = [
+        [TS, "1", "2", "0.5", "1.5", "10", "extra"],
+        [TS + HOUR, "1.5", "3", "1", "2.5"],  # no volume
+    ]
+
+    assert _Adapter()._process_candles(candles, "7d") == [
+        {"date": "2023-11-14T22:13:20+00:00", "price": 1.5, "volume": 10.0},
+        {"date": "2023-11-14T23:13:20+00:00", "price": 2.5, "volume": 0.0},
+    ]
+
+
+def test_process_candles_without_volume_column():
+    candles = [[TS, "1", "2", "0.5", "1.5"]]
+
+    assert _Adapter()._process_candles(candles, "7d") == [
+        {"date": "2023-11-14T22:13:20+00:00", "price": 1.5, "volume": 0.0},
+    ]
@@ -0,0 +1,113 @@
+import pytest
+
+from app.utils import circuit_breaker
+from app.utils.circuit_breaker import CircuitBreaker, CircuitState
+from tests.clock import FakeClock
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(circuit_breaker, "time", clock)
+    return clock
+
+
+def _breaker(**kwargs) -> CircuitBreaker:
+    return CircuitBreaker("test", **{"failure_threshold": 3, "sleep_window": 10.0, **kwargs})
+
+
+def test_stays_closed_below_failure_threshold(clock):
+    breaker = _breaker()
+    breaker.record_failure()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow()
+
+
+def test_opens_at_failure_threshold(clock):
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow()
+
+
+def test_stays_closed_below_error_percentage(clock):
+    breaker = _breaker(error_percentage=50)
+    for _ in range(4):
+        breaker.record_success()
+    for _ in range(3):
+        breaker.record_failure()
+
+    # 3 of 7 calls failed (< 50%)
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_failures_from_an_expired_window_are_forgotten(clock):
+    breaker = _breaker()
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.advance(10.0)
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.failure_count == 1
+
+
+def test_lets_one_probe_through_after_sleep_window(clock):
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_failure()
+
+    clock.advance(9.9)
+    assert not breaker.allow()
+
+    clock.advance(0.1)
+    assert breaker.allow()
+    assert breaker.state == CircuitState.HALF_OPEN
+    # Only one probe at a time
+    assert not breaker.allow()
+
+
+def test_successful_probe_closes(clock):
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_failure()
+    clock.advance(10.0)
+    assert breaker.allow()
+
+    breaker.record_success()
+
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.failure_count == 0
+    assert breaker.allow()
+
+
+def test_failed_probe_reopens(clock):
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_failure()
+    clock.advance(10.0)
+    assert breaker.allow()
+
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow()
+    clock.advance(10.0)
+    assert breaker.allow()
+
+
+def test_lost_probe_is_replaced_after_sleep_window(clock):
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_failure()
+    clock.advance(10.0)
+    assert breaker.allow()  # probe that never reports back
+
+    clock.advance(9.9)
+    assert not breaker.allow()
+    clock.advance(0.1)
+    assert breaker.allow()
@@ -0,0 +1,55 @@
+from sqlalchemy.dialects import postgresql
+
+from app.services.user_service import upsert_users_bulk
+
+
+class _RecordingSession:
+    """Records executed statements instead of running them"""
+
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, statement):
+        self.statements.append(statement)
+
+
+def _compile(statement):
+    return statement.compile(dialect=postgresql.dialect())
+
+
+def test_no_rows_executes_nothing():
+    db = _RecordingSession()
+
+    assert upsert_users_bulk(db, []) == 0
+    assert db.statements == []
+
+
+def test_duplicate_users_are_collapsed_last_row_wins():
+    db = _RecordingSession()
+    rows = [
+        {"id": 1, "username": "old", "first_name": "A", "last_name": None, "language_code": "en"},
+        {"id": 2, "username": "b", "first_name": "B", "last_name": None, "language_code": None},
+        {"id": 1, "username": "new", "first_name": "A", "last_name": None, "language_code": "en"},
+    ]
+
+    assert upsert_users_bulk(db, rows) == 2
+
+    params = _compile(db.statements[0]).params
+    usernames = {params[key] for key in params if key.startswith("username")}
+    assert usernames == {"new", "b"}
+    assert all(params[key] is True for key in params if key.startswith("is_active"))
+
+
+def test_conflict_clause_keeps_existing_fields_and_skips_unchanged_rows():
+    db = _RecordingSession()
+    upsert_users_bulk(db, [{"id": 1, "username": "a", "first_name": None, "last_name": None, "language_code": None}])
+
+    sql = " ".join(str(_compile(db.statements[0])).split())
+
+    assert "ON CONFLICT (id) DO UPDATE SET" in sql
+    # NULL profile fields don't overwrite stored values
+    assert "username = coalesce(excluded.username, users.username)" in sql
+    assert "updated_at = now()" in sql
+    # Rows without changes are not updated
+    assert "WHERE coalesce(excluded.username, users.username) IS DISTINCT FROM users.username" in sql
+    assert "is_active = " not in sql.split("DO UPDATE SET", 1)[1]